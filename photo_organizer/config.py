@@ -1,8 +1,10 @@
 """Configuration management for photo organizer"""
 
-from dataclasses import dataclass
+import os
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Pattern, Union
 
 
 @dataclass
@@ -16,7 +18,16 @@ class Config:
     rename_only: bool = False  # If True, rename in place without moving
     create_backups: bool = False
     verify_checksums: bool = True
+    # For copy verification; "sha256" or "md5" also supported
+    hash_algorithm: str = "blake2b"
     max_duplicate_suffix: int = 999  # photo_001.jpg, photo_002.jpg, etc.
+    # Threads reading files ahead; None = based on CPU count
+    max_workers: Optional[int] = None
+
+    # Matches names ending in a supported extension, compiled in __post_init__
+    _extension_re: Pattern[str] = field(
+        default=re.compile(r"(?!)"), init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if self.extensions is None:
@@ -24,11 +35,26 @@ class Config:
 
         # Normalize extensions to lowercase
         self.extensions = [ext.lower().lstrip('.') for ext in self.extensions]
+        # A single compiled pattern classifies a name in one pass. The leading
+        # "." requires a stem, so dotfiles like ".jpg" have no extension.
+        if self.extensions:
+            alternatives = "|".join(map(re.escape, self.extensions))
+            self._extension_re = re.compile(
+                rf"(?s).\.(?:{alternatives})\Z", re.IGNORECASE
+            )
+
+        # Work is I/O-bound, so use more threads than cores to keep requests in flight
+        if self.max_workers is None:
+            self.max_workers = min(32, (os.cpu_count() or 1) * 4)
 
         # Ensure output_dir is a Path object
         if not isinstance(self.output_dir, Path):
             self.output_dir = Path(self.output_dir)
 
-    def is_supported_extension(self, file_path: Path) -> bool:
-        """Check if file extension is supported"""
-        return file_path.suffix.lower().lstrip('.') in (self.extensions or [])
+    def is_supported_extension(self, file_path: Union[str, Path]) -> bool:
+        """Check if file extension is supported
+
+        Accepts a Path or a plain file name, e.g. from os.scandir entries.
+        """
+        name = file_path if isinstance(file_path, str) else file_path.name
+        return self._extension_re.search(name) is not None
@@ -1,13 +1,16 @@
 """Per-directory configuration management for photo organizer"""
 
+import copy
 import json
+import os
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupDriveConfig:
     """Configuration for a backup drive"""
 
@@ -26,7 +29,7 @@ class BackupDriveConfig:
             self.mount_path = Path(self.mount_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class GooglePhotosConfig:
     """Configuration for Google Photos integration"""
 
@@ -47,7 +50,7 @@ class GooglePhotosConfig:
     group_by: str = "month"  # "month", "year", "day"
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectoryConfig:
     """Configuration for a specific directory"""
 
@@ -93,6 +96,25 @@ class DirectoryConfig:
         self.updated_at = now
 
 
+# Path separators and problematic characters, replaced in a single pass
+_FILENAME_TRANSLATION = str.maketrans({
+    "\\": "_",
+    "/": "_",
+    ":": "_",
+    " ": "_",
+    "~": "home",
+})
+
+
+@lru_cache(maxsize=1024)
+def _path_str_to_filename(path_str: str) -> str:
+    """Convert a path string to a safe filename (cached, paths repeat across saves)"""
+    # Handle Windows drive letters (C:\ -> C_)
+    if len(path_str) >= 3 and path_str[1:3] == ':\\':
+        path_str = path_str[0] + '_' + path_str[3:]
+    return path_str.translate(_FILENAME_TRANSLATION).strip("_")
+
+
 class DirectoryConfigManager:
     """Manages per-directory configurations"""
 
@@ -111,10 +133,24 @@ class DirectoryConfigManager:
         # Global config file for directory mappings
         self.index_file = self.config_dir / "directory_index.json"
 
+        # Directory mapping last written to (or read from) the index file
+        self._saved_directories: Optional[Dict[str, str]] = None
+
+        # Parsed config files keyed by path, with the (mtime_ns, size) they were
+        # parsed at, so reload() only re-parses files that changed. Callers get
+        # copies; the cached objects are never handed out.
+        self._parse_cache: Dict[Path, Tuple[int, int, DirectoryConfig]] = {}
+
         # Load existing configurations
         self._directory_configs: Dict[str, DirectoryConfig] = {}
         self._load_index()
 
+    def reload(self) -> None:
+        """Re-read the index and configs from disk, discarding unsaved changes"""
+        self._directory_configs = {}
+        self._saved_directories = None
+        self._load_index()
+
     def _load_index(self) -> None:
         """Load the directory index and all configurations"""
         if not self.index_file.exists():
@@ -123,6 +159,7 @@ class DirectoryConfigManager:
         try:
             with open(self.index_file, 'r') as f:
                 index_data = json.load(f)
+            self._saved_directories = index_data.get("directories", {})
 
             for source_path_str, config_file in index_data.get("directories", {}).items():
                 config_path = self.config_dir / config_file
@@ -135,13 +172,27 @@ class DirectoryConfigManager:
             print(f"Warning: Could not load config index: {e}")
 
     def _load_config_file(self, config_path: Path) -> Optional[DirectoryConfig]:
-        """Load a single config file"""
+        """Load a single config file, skipping the parse if it is unchanged"""
+        try:
+            st = os.stat(config_path)
+            file_key: Optional[Tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            file_key = None
+
+        cached = self._parse_cache.get(config_path)
+        if file_key is not None and cached is not None and cached[:2] == file_key:
+            return copy.deepcopy(cached[2])
+
         try:
             with open(config_path, 'r') as f:
                 data = json.load(f)
 
             # Convert dict back to dataclass
             config = self._dict_to_config(data)
+            if file_key is not None:
+                self._parse_cache[config_path] = (
+                    file_key[0], file_key[1], copy.deepcopy(config)
+                )
             return config
 
         except Exception as e:
@@ -167,28 +218,27 @@ class DirectoryConfigManager:
         return DirectoryConfig(**config_data)
 
     def _save_index(self) -> None:
-        """Save the directory index"""
+        """Save the directory index, unless its directory mapping is unchanged"""
+        directories = {
+            str(source_path): f"{self._path_to_filename(source_path)}.json"
+            for source_path in self._directory_configs.keys()
+        }
+        if directories == self._saved_directories:
+            return
+
         index_data = {
-            "directories": {
-                str(source_path): f"{self._path_to_filename(source_path)}.json"
-                for source_path in self._directory_configs.keys()
-            },
+            "directories": directories,
             "updated_at": datetime.now().isoformat()
         }
 
+        # Serialize first and write once; json.dump issues a write per token chunk
         with open(self.index_file, 'w') as f:
-            json.dump(index_data, f, indent=2)
+            f.write(json.dumps(index_data, indent=2))
+        self._saved_directories = directories
 
     def _path_to_filename(self, path: Union[str, Path]) -> str:
         """Convert a path to a safe filename"""
-        path_str = str(path)
-        # Handle Windows drive letters (C:\ -> C_)
-        if len(path_str) >= 3 and path_str[1:3] == ':\\':
-            path_str = path_str[0] + '_' + path_str[3:]
-        # Replace path separators and problematic characters
-        safe_name = path_str.replace("\\", "_").replace("/", "_").replace(":", "_")
-        safe_name = safe_name.replace(" ", "_").replace("~", "home")
-        return safe_name.strip("_")
+        return _path_str_to_filename(str(path))
 
     def get_config(self, source_path: Union[str, Path]) -> Optional[DirectoryConfig]:
         """Get configuration for a directory"""
@@ -208,10 +258,11 @@ class DirectoryConfigManager:
             config_filename = f"{self._path_to_filename(source_path_str)}.json"
             config_path = self.config_dir / config_filename
 
+            # Convert to dict for JSON serialization
+            config_dict = self._config_to_dict(config)
             with open(config_path, 'w') as f:
-                # Convert to dict for JSON serialization
-                config_dict = self._config_to_dict(config)
-                json.dump(config_dict, f, indent=2)
+                f.write(json.dumps(config_dict, indent=2))
+            self._parse_cache.pop(config_path, None)
 
             # Update index
             self._save_index()
@@ -252,8 +303,11 @@ class DirectoryConfigManager:
                 # Remove config file
                 config_filename = f"{self._path_to_filename(source_path_str)}.json"
                 config_path = self.config_dir / config_filename
-                if config_path.exists():
-                    config_path.unlink()
+                self._parse_cache.pop(config_path, None)
+                try:
+                    os.unlink(config_path)
+                except FileNotFoundError:
+                    pass
 
                 # Update index
                 self._save_index()
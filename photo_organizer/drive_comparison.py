@@ -1,10 +1,12 @@
 """Drive comparison functionality using existing SQLite database"""
 
 import hashlib
+import mmap
 import sqlite3
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 import time
@@ -12,10 +14,68 @@ import signal
 import shutil
 import os
 
+from .file_utils import content_sha256
+
+
+def _checksum_to_db(checksum: str) -> Union[bytes, str]:
+    """Convert a hex digest to the raw bytes stored in drive databases"""
+    try:
+        return bytes.fromhex(checksum)
+    except ValueError:
+        return checksum
+
+
+def _checksum_from_db(value: Union[bytes, str]) -> str:
+    """Convert a stored checksum back to hex
+
+    Databases written by older versions store hex text, newer rows store
+    the raw digest, which halves the column and index size.
+    """
+    return value.hex() if isinstance(value, bytes) else value
+
+
+def _diff_drive_files(
+    drive1_files: Dict[str, Tuple[int, str]],
+    drive2_files: Dict[str, Tuple[int, str]],
+) -> Tuple[List[str], List[str], List[dict], List[str]]:
+    """Split two drive listings into missing, different and identical files
+
+    Returns (only_in_drive1, only_in_drive2, different_files, identical_files),
+    with paths sorted so copies and reports follow a stable order.
+    """
+    # Key views support set operations directly, without copying either listing
+    keys1 = drive1_files.keys()
+    keys2 = drive2_files.keys()
+
+    different_files = []
+    identical_files = []
+    for file_path in sorted(keys1 & keys2):
+        size1, checksum1 = drive1_files[file_path]
+        size2, checksum2 = drive2_files[file_path]
+        if checksum1 == checksum2:
+            identical_files.append(file_path)
+        else:
+            different_files.append(
+                {
+                    "path": file_path,
+                    "drive1": {"size": size1, "checksum": checksum1},
+                    "drive2": {"size": size2, "checksum": checksum2},
+                }
+            )
+
+    return (
+        sorted(keys1 - keys2),
+        sorted(keys2 - keys1),
+        different_files,
+        identical_files,
+    )
+
 
 class DriveScanner:
     """Scanner for backup drives using the existing database structure"""
 
+    UNCACHED_READ_THRESHOLD = 16 * 1024 * 1024  # Bytes
+
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self._lock = threading.Lock()  # For thread-safe logging and DB operations
@@ -23,40 +83,54 @@ class DriveScanner:
 
     def _get_file_checksum(self, file_path: Path) -> str:
         """Calculate SHA-256 checksum of file"""
-        sha256_hash = hashlib.sha256()
         try:
             with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+                # file_digest reads into its own buffer and hashes without the GIL
+                digest = hashlib.file_digest(f, content_sha256).hexdigest()
+
+                # Large files are read once per scan; drop them from the page cache
+                # so they don't evict the databases and directory metadata
+                if (
+                    hasattr(os, "posix_fadvise")
+                    and os.fstat(f.fileno()).st_size > self.UNCACHED_READ_THRESHOLD
+                ):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                return digest
         except Exception as e:
             self.logger.error(f"Error reading {file_path}: {e}")
             return ""
 
     def _get_file_checksum_fast(self, file_path: Path) -> str:
-        """Calculate SHA-256 checksum with larger buffer for speed"""
-        sha256_hash = hashlib.sha256()
-        try:
-            with open(file_path, "rb") as f:
-                # Use 64KB buffer instead of 4KB for better performance
-                for byte_block in iter(lambda: f.read(65536), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
-        except Exception as e:
-            self.logger.error(f"Error reading {file_path}: {e}")
-            return ""
+        """Calculate SHA-256 checksum of file (alias of _get_file_checksum)"""
+        return self._get_file_checksum(file_path)
 
     def cancel(self) -> None:
         """Cancel ongoing operations"""
         self._cancelled.set()
 
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        """Open the drive database tuned for bulk writes
+
+        WAL with synchronous=NORMAL only syncs at checkpoints instead of on
+        every commit, which matters for the per-file updates during backups.
+        """
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
     def _process_file_batch(
-        self, files_batch: List[Path], drive_path: Path
+        self, files_batch: List[Tuple[Path, os.stat_result]], drive_path: Path
     ) -> List[Tuple]:
-        """Process a batch of files and return their data for DB insertion"""
+        """Process a batch of files and return their data for DB insertion
+
+        Each file comes with the stat result taken while walking the drive,
+        so it is not stat'ed again here.
+        """
         batch_data = []
 
-        for file_path in files_batch:
+        for file_path, file_stat in files_batch:
             # Check for cancellation
             if self._cancelled.is_set():
                 with self._lock:
@@ -65,7 +139,6 @@ class DriveScanner:
 
             try:
                 relative_path = file_path.relative_to(drive_path)
-                file_size = file_path.stat().st_size
                 checksum = self._get_file_checksum_fast(file_path)
 
                 if checksum:
@@ -73,8 +146,9 @@ class DriveScanner:
                         (
                             str(relative_path),
                             str(file_path),
-                            file_size,
-                            checksum,
+                            file_stat.st_size,
+                            file_stat.st_mtime_ns,
+                            _checksum_to_db(checksum),
                             str(drive_path),
                         )
                     )
@@ -87,9 +161,41 @@ class DriveScanner:
 
         return batch_data
 
-    def scan_drive_to_db(self, drive_path: Path, db_path: Optional[Path] = None) -> int:
+    def _iter_drive_files(
+        self, drive_path: Path
+    ) -> Iterator[Tuple[Path, os.stat_result]]:
+        """Yield non-hidden files under drive_path along with their stat results
+
+        Uses os.scandir, so directory entries already carry their type and
+        each file needs a single stat(). Symlinked directories are not followed.
+        """
+        pending = [str(drive_path)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file() and not entry.name.startswith("."):
+                                yield Path(entry.path), entry.stat()
+                        except OSError as e:
+                            self.logger.error(f"Error checking {entry.path}: {e}")
+            except OSError as e:
+                self.logger.error(f"Could not read directory {directory}: {e}")
+
+    def scan_drive_to_db(
+        self,
+        drive_path: Path,
+        db_path: Optional[Path] = None,
+        force_rescan: bool = False,
+    ) -> int:
         """Scan a drive and store file info in database
 
+        Files whose size and modification time match the previous scan keep
+        their stored checksum unless force_rescan is set.
+
         Returns number of files scanned
         """
         if not drive_path.exists():
@@ -100,30 +206,32 @@ class DriveScanner:
             db_path = drive_path / ".photo_organizer_drive_scan.sqlite"
 
         # Initialize database
-        conn = sqlite3.connect(db_path)
+        conn = self._connect(db_path)
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS drive_files (
                 relative_path TEXT PRIMARY KEY,
                 full_path TEXT,
                 file_size INTEGER,
-                checksum TEXT,
+                checksum BLOB,
                 scanned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                drive_path TEXT
+                drive_path TEXT,
+                mtime_ns INTEGER
             )
         """
         )
+        # Databases from older versions lack the modification time column
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(drive_files)")}
+        if "mtime_ns" not in columns:
+            conn.execute("ALTER TABLE drive_files ADD COLUMN mtime_ns INTEGER")
         conn.commit()
 
         self.logger.info(f"Scanning drive: {drive_path}")
 
         files_scanned = 0
-        files_to_process = []
 
-        # Collect all files first
-        for file_path in drive_path.rglob("*"):
-            if file_path.is_file() and not file_path.name.startswith("."):
-                files_to_process.append(file_path)
+        # Collect all files first, with the stat taken during the walk
+        files_to_process = list(self._iter_drive_files(drive_path))
 
         self.logger.info(f"Found {len(files_to_process)} files to scan")
 
@@ -135,36 +243,30 @@ class DriveScanner:
             "CREATE INDEX IF NOT EXISTS idx_relative_path ON drive_files(relative_path)"
         )
 
-        # Get existing files with their modification times
-        existing_files = {}
-        cursor = conn.execute(
-            "SELECT full_path, file_size, scanned_at FROM drive_files WHERE drive_path = ?",
-            (str(drive_path),),
-        )
-        for row in cursor:
-            existing_files[row[0]] = {"size": row[1], "scanned_at": row[2]}
+        # Get existing files with their sizes and modification times
+        existing_files: Dict[str, Tuple[int, Optional[int]]] = {}
+        if not force_rescan:
+            cursor = conn.execute(
+                "SELECT full_path, file_size, mtime_ns FROM drive_files "
+                "WHERE drive_path = ?",
+                (str(drive_path),),
+            )
+            for row in cursor:
+                existing_files[row[0]] = (row[1], row[2])
 
         # Filter files that haven't changed
         files_to_scan = []
         files_skipped = 0
 
-        for file_path in files_to_process:
-            try:
-                file_stat = file_path.stat()
-                file_size = file_stat.st_size
-
-                existing = existing_files.get(str(file_path))
-                if existing and existing["size"] == file_size:
-                    # File exists in DB with same size, assume unchanged
-                    files_skipped += 1
-                    continue
-
-                files_to_scan.append(file_path)
-
-            except Exception as e:
-                self.logger.error(f"Error checking {file_path}: {e}")
+        for file_path, file_stat in files_to_process:
+            existing = existing_files.get(str(file_path))
+            if existing == (file_stat.st_size, file_stat.st_mtime_ns):
+                # Same size and modification time as last scan, keep its checksum
+                files_skipped += 1
                 continue
 
+            files_to_scan.append((file_path, file_stat))
+
         self.logger.info(
             f"Skipping {files_skipped} unchanged files, scanning {len(files_to_scan)} files"
         )
@@ -176,8 +278,9 @@ class DriveScanner:
 
         # Process files in parallel
         batch_size = 20  # Files per batch
+        # hashlib releases the GIL, so hashing scales with the available cores
         max_workers = min(
-            4, (len(files_to_scan) + batch_size - 1) // batch_size
+            os.cpu_count() or 1, (len(files_to_scan) + batch_size - 1) // batch_size
         )  # Don't over-parallelize
 
         self.logger.info(f"Processing with {max_workers} threads...")
@@ -239,8 +342,8 @@ class DriveScanner:
             conn.executemany(
                 """
                 INSERT OR REPLACE INTO drive_files
-                (relative_path, full_path, file_size, checksum, drive_path)
-                VALUES (?, ?, ?, ?, ?)
+                (relative_path, full_path, file_size, mtime_ns, checksum, drive_path)
+                VALUES (?, ?, ?, ?, ?, ?)
             """,
                 all_results,
             )
@@ -274,7 +377,7 @@ class DriveScanner:
             )
             for row in cursor:
                 relative_path, file_size, checksum = row
-                files[relative_path] = (file_size, checksum)
+                files[relative_path] = (file_size, _checksum_from_db(checksum))
         finally:
             conn.close()
 
@@ -290,14 +393,28 @@ class DriveScanner:
     ) -> None:
         """Add a single file to the drive database"""
         try:
-            conn = sqlite3.connect(db_path)
+            # Record the modification time so the next scan can skip this file
+            try:
+                mtime_ns: Optional[int] = os.stat(full_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+
+            conn = self._connect(db_path)
             conn.execute(
                 """
                 INSERT OR REPLACE INTO drive_files
-                (relative_path, full_path, file_size, checksum, drive_path, scanned_at)
-                VALUES (?, ?, ?, ?, ?, datetime('now'))
+                (relative_path, full_path, file_size, mtime_ns, checksum,
+                 drive_path, scanned_at)
+                VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
             """,
-                (relative_path, full_path, file_size, checksum, str(db_path.parent)),
+                (
+                    relative_path,
+                    full_path,
+                    file_size,
+                    mtime_ns,
+                    _checksum_to_db(checksum),
+                    str(db_path.parent),
+                ),
             )
             conn.commit()
             conn.close()
@@ -308,6 +425,12 @@ class DriveScanner:
 class DriveSynchronizer:
     """Synchronizes files between backup drives"""
 
+    MAX_COPY_WORKERS = 4  # Concurrent copies across both drives
+    _DRIVE_LABELS = {
+        "files_copied_to_drive1": "Drive 1",
+        "files_copied_to_drive2": "Drive 2",
+    }
+
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self._lock = threading.Lock()
@@ -335,13 +458,13 @@ class DriveSynchronizer:
             # Ensure target directory exists
             target_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Get source checksum for verification
             source_checksum = None
             if verify:
-                source_checksum = self._calculate_checksum(source_path)
-
-            # Copy file with metadata preservation
-            shutil.copy2(source_path, target_path)
+                # Hash the source while copying it, so it is only read once
+                source_checksum = self._copy_with_checksum(source_path, target_path)
+            else:
+                # Copy file with metadata preservation (in-kernel on Linux)
+                shutil.copy2(source_path, target_path)
 
             # Verify copy if requested
             if verify and source_checksum:
@@ -357,18 +480,114 @@ class DriveSynchronizer:
             self.logger.error(f"Failed to copy {source_path} -> {target_path}: {e}")
             return False
 
+    def _copy_with_checksum(self, source_path: Path, target_path: Path) -> str:
+        """Copy a file with its metadata, returning the SHA-256 of the data copied"""
+        sha256_hash = hashlib.sha256(usedforsecurity=False)
+        buffer = bytearray(1024 * 1024)
+        view = memoryview(buffer)
+        try:
+            with (
+                open(source_path, "rb", buffering=0) as src,
+                open(target_path, "wb") as dst,
+            ):
+                while n := src.readinto(buffer):
+                    sha256_hash.update(view[:n])
+                    dst.write(view[:n])
+
+                # The source won't be read again, don't keep it in the page cache
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            shutil.copystat(source_path, target_path)
+        except Exception:
+            # Don't leave a truncated copy behind
+            target_path.unlink(missing_ok=True)
+            raise
+        return sha256_hash.hexdigest()
+
     def _calculate_checksum(self, file_path: Path) -> str:
         """Calculate SHA-256 checksum of file"""
-        sha256_hash = hashlib.sha256()
+        sha256_hash = hashlib.sha256(usedforsecurity=False)
         try:
             with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(65536), b""):
-                    sha256_hash.update(byte_block)
+                # Small files are cheaper to read than to map
+                if os.fstat(f.fileno()).st_size >= 1024 * 1024:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mmap, "MADV_SEQUENTIAL"):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        sha256_hash.update(mm)
+                else:
+                    sha256_hash.update(f.read())
             return sha256_hash.hexdigest()
         except Exception as e:
             self.logger.error(f"Error calculating checksum for {file_path}: {e}")
             return ""
 
+    def _copy_unless_cancelled(
+        self, source_path: Path, target_path: Path
+    ) -> Optional[bool]:
+        """Copy a file from a worker thread; returns None if cancelled first"""
+        if self._cancelled.is_set():
+            return None
+        return self._safe_copy_file(source_path, target_path)
+
+    def _run_copy_jobs(
+        self,
+        copy_jobs: List[Tuple[str, Path, Path, int, str]],
+        sync_stats: Dict[str, int],
+        dry_run: bool,
+    ) -> None:
+        """Copy files on a thread pool and record the results in sync_stats
+
+        Copies in both directions run together, so reads from one drive overlap
+        with writes to the other. Statistics and progress are only updated on
+        this thread, as each copy finishes.
+        """
+        totals = Counter(stats_key for *_, stats_key in copy_jobs)
+        finished: Dict[str, int] = dict.fromkeys(totals, 0)
+
+        if dry_run:
+            for file_path, _, _, file_size, stats_key in copy_jobs:
+                finished[stats_key] += 1
+                self.logger.info(
+                    f"[{finished[stats_key]}/{totals[stats_key]}] "
+                    f"Would copy to {self._DRIVE_LABELS[stats_key]}: {file_path}"
+                )
+                sync_stats[stats_key] += 1
+                sync_stats["bytes_copied"] += file_size
+            return
+
+        if not copy_jobs:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.MAX_COPY_WORKERS) as executor:
+            future_to_job = {
+                executor.submit(self._copy_unless_cancelled, source, target): (
+                    file_path,
+                    file_size,
+                    stats_key,
+                )
+                for file_path, source, target, file_size, stats_key in copy_jobs
+            }
+
+            for future in as_completed(future_to_job):
+                file_path, file_size, stats_key = future_to_job[future]
+                copied = future.result()
+                if copied is None:
+                    continue  # Cancelled before copying
+
+                finished[stats_key] += 1
+                progress = f"[{finished[stats_key]}/{totals[stats_key]}]"
+                drive_label = self._DRIVE_LABELS[stats_key]
+                if copied:
+                    self.logger.info(f"{progress} Copied to {drive_label}: {file_path}")
+                    sync_stats[stats_key] += 1
+                    sync_stats["bytes_copied"] += file_size
+                else:
+                    self.logger.error(
+                        f"{progress} Failed to copy to {drive_label}: {file_path}"
+                    )
+                    sync_stats["errors"] += 1
+
     def sync_drives(
         self,
         drive1_path: Path,
@@ -384,23 +603,10 @@ class DriveSynchronizer:
         if self._cancelled.is_set():
             return {}
 
-        # Find files that need syncing
-        only_in_drive1 = [f for f in drive1_files.keys() if f not in drive2_files]
-        only_in_drive2 = [f for f in drive2_files.keys() if f not in drive1_files]
-
-        # Find files with different content
-        different_files = []
-        for file_path in set(drive1_files.keys()) & set(drive2_files.keys()):
-            size1, checksum1 = drive1_files[file_path]
-            size2, checksum2 = drive2_files[file_path]
-            if checksum1 != checksum2:
-                different_files.append(
-                    {
-                        "path": file_path,
-                        "drive1": {"size": size1, "checksum": checksum1},
-                        "drive2": {"size": size2, "checksum": checksum2},
-                    }
-                )
+        # Find files that need syncing and files with different content
+        only_in_drive1, only_in_drive2, different_files, _ = _diff_drive_files(
+            drive1_files, drive2_files
+        )
 
         # Calculate space requirements
         space_needed_drive1 = sum(drive2_files[f][0] for f in only_in_drive2)
@@ -430,57 +636,42 @@ class DriveSynchronizer:
         if dry_run:
             self.logger.info("DRY RUN MODE - No files will be copied")
 
+        # Copy jobs for both directions: (path, source, target, size, stats key)
+        copy_jobs: List[Tuple[str, Path, Path, int, str]] = []
+
         # Copy files missing from Drive 1
         if only_in_drive2:
             self.logger.info(
                 f"\n=== Copying {len(only_in_drive2)} files to Drive 1 ==="
             )
-            for i, file_path in enumerate(only_in_drive2, 1):
-                if self._cancelled.is_set():
-                    break
-
-                source_path = drive2_path / file_path
-                target_path = drive1_path / file_path
-
-                self.logger.info(
-                    f"[{i}/{len(only_in_drive2)}] Copying to Drive 1: {file_path}"
+            for file_path in only_in_drive2:
+                copy_jobs.append(
+                    (
+                        file_path,
+                        drive2_path / file_path,
+                        drive1_path / file_path,
+                        drive2_files[file_path][0],
+                        "files_copied_to_drive1",
+                    )
                 )
 
-                if not dry_run:
-                    if self._safe_copy_file(source_path, target_path):
-                        sync_stats["files_copied_to_drive1"] += 1
-                        sync_stats["bytes_copied"] += drive2_files[file_path][0]
-                    else:
-                        sync_stats["errors"] += 1
-                else:
-                    sync_stats["files_copied_to_drive1"] += 1
-                    sync_stats["bytes_copied"] += drive2_files[file_path][0]
-
         # Copy files missing from Drive 2
         if only_in_drive1:
             self.logger.info(
                 f"\n=== Copying {len(only_in_drive1)} files to Drive 2 ==="
             )
-            for i, file_path in enumerate(only_in_drive1, 1):
-                if self._cancelled.is_set():
-                    break
-
-                source_path = drive1_path / file_path
-                target_path = drive2_path / file_path
-
-                self.logger.info(
-                    f"[{i}/{len(only_in_drive1)}] Copying to Drive 2: {file_path}"
+            for file_path in only_in_drive1:
+                copy_jobs.append(
+                    (
+                        file_path,
+                        drive1_path / file_path,
+                        drive2_path / file_path,
+                        drive1_files[file_path][0],
+                        "files_copied_to_drive2",
+                    )
                 )
 
-                if not dry_run:
-                    if self._safe_copy_file(source_path, target_path):
-                        sync_stats["files_copied_to_drive2"] += 1
-                        sync_stats["bytes_copied"] += drive1_files[file_path][0]
-                    else:
-                        sync_stats["errors"] += 1
-                else:
-                    sync_stats["files_copied_to_drive2"] += 1
-                    sync_stats["bytes_copied"] += drive1_files[file_path][0]
+        self._run_copy_jobs(copy_jobs, sync_stats, dry_run)
 
         # Handle files with different content
         if different_files:
@@ -505,8 +696,13 @@ def compare_backup_drives(
     drive2_path: Path,
     logger: logging.Logger,
     force_rescan: bool = False,
+    rescan: bool = False,
 ) -> None:
-    """Compare two backup drives and show differences"""
+    """Compare two backup drives and show differences
+
+    Existing scans are reused as they are unless rescan is set, which updates
+    them by hashing only new or modified files; force_rescan hashes every file.
+    """
 
     logger.info("=== Backup Drive Comparison ===")
     logger.info(f"Drive 1: {drive1_path}")
@@ -537,8 +733,8 @@ def compare_backup_drives(
         db2_path = drive2_path / ".photo_organizer_drive_scan.sqlite"
 
         # Scan both drives (or use existing scans)
-        drive1_needs_scan = force_rescan or not db1_path.exists()
-        drive2_needs_scan = force_rescan or not db2_path.exists()
+        drive1_needs_scan = rescan or force_rescan or not db1_path.exists()
+        drive2_needs_scan = rescan or force_rescan or not db2_path.exists()
 
         if scanner._cancelled.is_set():
             logger.info("Operation cancelled before scanning")
@@ -550,10 +746,10 @@ def compare_backup_drives(
             # Scan both drives simultaneously
             with ThreadPoolExecutor(max_workers=2) as executor:
                 future1 = executor.submit(
-                    scanner.scan_drive_to_db, drive1_path, db1_path
+                    scanner.scan_drive_to_db, drive1_path, db1_path, force_rescan
                 )
                 future2 = executor.submit(
-                    scanner.scan_drive_to_db, drive2_path, db2_path
+                    scanner.scan_drive_to_db, drive2_path, db2_path, force_rescan
                 )
 
                 # Wait for both to complete
@@ -572,13 +768,13 @@ def compare_backup_drives(
 
         elif drive1_needs_scan:
             logger.info("\n--- Scanning Drive 1 ---")
-            scanner.scan_drive_to_db(drive1_path, db1_path)
+            scanner.scan_drive_to_db(drive1_path, db1_path, force_rescan)
         elif drive2_needs_scan:
             logger.info("\n--- Scanning Drive 2 ---")
-            scanner.scan_drive_to_db(drive2_path, db2_path)
+            scanner.scan_drive_to_db(drive2_path, db2_path, force_rescan)
         else:
             logger.info(
-                "Using existing scans for both drives (use --rescan to force rescan)"
+                "Using existing scans for both drives (use --rescan to pick up changes)"
             )
 
         if scanner._cancelled.is_set():
@@ -598,44 +794,16 @@ def compare_backup_drives(
             return
 
         # Find differences
-        only_in_drive1 = []
-        only_in_drive2 = []
-        different_files = []
-        identical_files = []
-
-        all_files = set(drive1_files.keys()) | set(drive2_files.keys())
-
-        for file_path in all_files:
-            if scanner._cancelled.is_set():
-                logger.info("Comparison cancelled by user")
-                return
-
-            if file_path in drive1_files and file_path in drive2_files:
-                # File exists in both drives
-                size1, checksum1 = drive1_files[file_path]
-                size2, checksum2 = drive2_files[file_path]
-
-                if checksum1 == checksum2:
-                    identical_files.append(file_path)
-                else:
-                    different_files.append(
-                        {
-                            "path": file_path,
-                            "drive1": {"size": size1, "checksum": checksum1},
-                            "drive2": {"size": size2, "checksum": checksum2},
-                        }
-                    )
-            elif file_path in drive1_files:
-                only_in_drive1.append(file_path)
-            else:
-                only_in_drive2.append(file_path)
+        only_in_drive1, only_in_drive2, different_files, identical_files = (
+            _diff_drive_files(drive1_files, drive2_files)
+        )
 
         # Report results
         logger.info(
             f"\n=== Files Missing from Drive 2 ({len(only_in_drive1)} files) ==="
         )
         if only_in_drive1:
-            for file_path in sorted(only_in_drive1)[:20]:  # Show first 20
+            for file_path in only_in_drive1[:20]:  # Show first 20
                 size, _ = drive1_files[file_path]
                 logger.info(f"  {file_path} ({size:,} bytes)")
             if len(only_in_drive1) > 20:
@@ -647,7 +815,7 @@ def compare_backup_drives(
             f"\n=== Files Missing from Drive 1 ({len(only_in_drive2)} files) ==="
         )
         if only_in_drive2:
-            for file_path in sorted(only_in_drive2)[:20]:  # Show first 20
+            for file_path in only_in_drive2[:20]:  # Show first 20
                 size, _ = drive2_files[file_path]
                 logger.info(f"  {file_path} ({size:,} bytes)")
             if len(only_in_drive2) > 20:
@@ -675,7 +843,12 @@ def compare_backup_drives(
             logger.info("  ✓ All common files have identical content")
 
         # Summary
-        total_files = len(all_files)
+        total_files = (
+            len(only_in_drive1)
+            + len(only_in_drive2)
+            + len(different_files)
+            + len(identical_files)
+        )
         files_needing_sync = (
             len(only_in_drive1) + len(only_in_drive2) + len(different_files)
         )
@@ -719,9 +892,12 @@ def sync_backup_drives(
     logger: logging.Logger,
     force_rescan: bool = False,
     dry_run: bool = False,
+    rescan: bool = False,
 ) -> bool:
     """Compare and synchronize two backup drives
 
+    Scans are reused or refreshed as in compare_backup_drives.
+
     Returns True if sync was successful, False otherwise
     """
     # Set up signal handling for graceful shutdown
@@ -745,8 +921,8 @@ def sync_backup_drives(
         db2_path = drive2_path / ".photo_organizer_drive_scan.sqlite"
 
         # Scan both drives (or use existing scans)
-        drive1_needs_scan = force_rescan or not db1_path.exists()
-        drive2_needs_scan = force_rescan or not db2_path.exists()
+        drive1_needs_scan = rescan or force_rescan or not db1_path.exists()
+        drive2_needs_scan = rescan or force_rescan or not db2_path.exists()
 
         if scanner._cancelled.is_set():
             logger.info("Operation cancelled before scanning")
@@ -758,10 +934,10 @@ def sync_backup_drives(
             # Scan both drives simultaneously
             with ThreadPoolExecutor(max_workers=2) as executor:
                 future1 = executor.submit(
-                    scanner.scan_drive_to_db, drive1_path, db1_path
+                    scanner.scan_drive_to_db, drive1_path, db1_path, force_rescan
                 )
                 future2 = executor.submit(
-                    scanner.scan_drive_to_db, drive2_path, db2_path
+                    scanner.scan_drive_to_db, drive2_path, db2_path, force_rescan
                 )
 
                 # Wait for both to complete
@@ -780,13 +956,13 @@ def sync_backup_drives(
 
         elif drive1_needs_scan:
             logger.info("\n--- Scanning Drive 1 ---")
-            scanner.scan_drive_to_db(drive1_path, db1_path)
+            scanner.scan_drive_to_db(drive1_path, db1_path, force_rescan)
         elif drive2_needs_scan:
             logger.info("\n--- Scanning Drive 2 ---")
-            scanner.scan_drive_to_db(drive2_path, db2_path)
+            scanner.scan_drive_to_db(drive2_path, db2_path, force_rescan)
         else:
             logger.info(
-                "Using existing scans for both drives (use --rescan to force rescan)"
+                "Using existing scans for both drives (use --rescan to pick up changes)"
             )
 
         if scanner._cancelled.is_set():
@@ -805,28 +981,16 @@ def sync_backup_drives(
         logger.info(f"Drive 2 ({drive2_path}): {len(drive2_files)} files")
 
         # Find differences
-        only_in_drive1 = [f for f in drive1_files.keys() if f not in drive2_files]
-        only_in_drive2 = [f for f in drive2_files.keys() if f not in drive1_files]
-        different_files = []
-
-        for file_path in set(drive1_files.keys()) & set(drive2_files.keys()):
-            size1, checksum1 = drive1_files[file_path]
-            size2, checksum2 = drive2_files[file_path]
-            if checksum1 != checksum2:
-                different_files.append(
-                    {
-                        "path": file_path,
-                        "drive1": {"size": size1, "checksum": checksum1},
-                        "drive2": {"size": size2, "checksum": checksum2},
-                    }
-                )
+        only_in_drive1, only_in_drive2, different_files, identical_files = (
+            _diff_drive_files(drive1_files, drive2_files)
+        )
 
         # Report differences
         logger.info(
             f"\n=== Files Missing from Drive 2 ({len(only_in_drive1)} files) ==="
         )
         if only_in_drive1:
-            for file_path in sorted(only_in_drive1)[:20]:  # Show first 20
+            for file_path in only_in_drive1[:20]:  # Show first 20
                 size, _ = drive1_files[file_path]
                 logger.info(f"  {file_path} ({size:,} bytes)")
             if len(only_in_drive1) > 20:
@@ -838,7 +1002,7 @@ def sync_backup_drives(
             f"\n=== Files Missing from Drive 1 ({len(only_in_drive2)} files) ==="
         )
         if only_in_drive2:
-            for file_path in sorted(only_in_drive2)[:20]:  # Show first 20
+            for file_path in only_in_drive2[:20]:  # Show first 20
                 size, _ = drive2_files[file_path]
                 logger.info(f"  {file_path} ({size:,} bytes)")
             if len(only_in_drive2) > 20:
@@ -866,7 +1030,12 @@ def sync_backup_drives(
             logger.info("  ✓ All common files have identical content")
 
         # Summary
-        total_files = len(set(drive1_files.keys()) | set(drive2_files.keys()))
+        total_files = (
+            len(only_in_drive1)
+            + len(only_in_drive2)
+            + len(different_files)
+            + len(identical_files)
+        )
         files_needing_sync = (
             len(only_in_drive1) + len(only_in_drive2) + len(different_files)
         )
@@ -937,6 +1106,7 @@ def backup_archive_to_drives(
     logger: logging.Logger,
     dry_run: bool = False,
     rescan: bool = False,
+    force_rescan: bool = False,
 ) -> bool:
     """Backup local archive to one or more backup drives
 
@@ -945,6 +1115,8 @@ def backup_archive_to_drives(
         drive_paths: List of paths to backup drives
         logger: Logger instance
         dry_run: If True, show what would be done without actually doing it
+        rescan: If True, update existing drive scans with new or modified files
+        force_rescan: If True, hash every file on the drives again
 
     Returns:
         True if backup was successful, False otherwise
@@ -1062,13 +1234,13 @@ def backup_archive_to_drives(
             db_path = drive_path / ".photo_organizer_drive_scan.sqlite"
 
             # Check if we already have a scan of this drive
-            if db_path.exists() and not rescan:
+            if db_path.exists() and not (rescan or force_rescan):
                 logger.info(f"Using existing scan data for {drive_path}")
                 drive_files[drive_path] = scanner.get_drive_files(db_path)
             else:
                 # Scan drive to get current file list
                 logger.info(f"Scanning drive {drive_path}...")
-                scanner.scan_drive_to_db(drive_path, db_path)
+                scanner.scan_drive_to_db(drive_path, db_path, force_rescan)
                 drive_files[drive_path] = scanner.get_drive_files(db_path)
 
             if scanner._cancelled.is_set():
@@ -1,14 +1,24 @@
 """File operation utilities with safety checks"""
 
+import os
 import shutil
 import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 import logging
 
 from .config import Config
 
 
+def content_sha256() -> "hashlib._Hash":
+    """New SHA-256 object for content fingerprints rather than security
+
+    usedforsecurity=False keeps hashing available on FIPS-restricted builds
+    and lets OpenSSL skip its security-policy checks.
+    """
+    return hashlib.sha256(usedforsecurity=False)
+
+
 class FileOperations:
     """Safe file operations with verification"""
 
@@ -16,31 +26,30 @@ class FileOperations:
         self.config = config
         self.logger = logger
 
+        # Directories already created by this instance; target directories are
+        # shared by many files, so each one only needs a single mkdir
+        self._ensured_dirs: Set[str] = set()
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create directory (and parents) unless already done by this instance"""
+        directory_str = str(directory)
+        if directory_str in self._ensured_dirs:
+            return
+
+        os.makedirs(directory_str, exist_ok=True)
+        self._ensured_dirs.add(directory_str)
+
     def safe_copy(self, source: Path, target: Path, verify: bool = True) -> bool:
         """Safely copy file with optional verification"""
         try:
             # Ensure target directory exists
-            target.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(target.parent)
 
             if self.config.dry_run:
                 self.logger.info(f"DRY RUN: Would copy {source} -> {target}")
                 return True
 
-            # Get original checksum if verification is enabled
-            original_checksum = None
-            if verify:
-                original_checksum = self._calculate_checksum(source)
-
-            # Perform copy with metadata preservation
-            shutil.copy2(source, target)
-
-            # Verify copy if requested
-            if verify and original_checksum:
-                new_checksum = self._calculate_checksum(target)
-                if original_checksum != new_checksum:
-                    # Remove corrupted copy
-                    target.unlink(missing_ok=True)
-                    raise ValueError("Copy verification failed: checksums don't match")
+            self._copy_into_place(source, target, verify)
 
             self.logger.debug(f"Successfully copied: {source} -> {target}")
             return True
@@ -53,30 +62,19 @@ class FileOperations:
         """Safely move file with optional verification"""
         try:
             # Ensure target directory exists
-            target.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(target.parent)
 
             if self.config.dry_run:
                 self.logger.info(f"DRY RUN: Would move {source} -> {target}")
                 return True
 
-            # Get original checksum if verification is enabled
-            original_checksum = None
-            if verify:
-                original_checksum = self._calculate_checksum(source)
-
             # ALWAYS use safe copy-then-delete approach for maximum safety
             # Never use shutil.move() which can delete source before ensuring target is safe
+            # (nor a bare os.rename() fast path, which would skip the verified copy)
 
-            # Copy to destination first
-            shutil.copy2(source, target)
-
-            # Verify copy if requested
-            if verify and original_checksum:
-                new_checksum = self._calculate_checksum(target)
-                if original_checksum != new_checksum:
-                    # Remove corrupted copy, keep original
-                    target.unlink(missing_ok=True)
-                    raise ValueError("Move verification failed: checksums don't match")
+            # Copy to destination first, flushed to disk since the source is
+            # deleted next
+            self._copy_into_place(source, target, verify, durable=True)
 
             # Only delete original after successful copy and verification
             source.unlink()
@@ -88,6 +86,57 @@ class FileOperations:
             self.logger.error(f"Move failed {source} -> {target}: {e}")
             return False
 
+    def _copy_into_place(
+        self, source: Path, target: Path, verify: bool, durable: bool = False
+    ) -> None:
+        """Copy source to target, publishing it under its final name only when complete
+
+        The data is written to a hidden temporary file next to the target and
+        verified there, so a failed or interrupted copy never leaves a partial
+        file under the target name.
+        """
+        # Get original checksum if verification is enabled
+        original_checksum = None
+        if verify:
+            original_checksum = self._calculate_checksum(source)
+
+        partial = target.with_name(f".{target.name}.partial")
+        try:
+            # Perform copy with metadata preservation; on Linux shutil copies the
+            # data in-kernel with sendfile(), so no userspace read/write loop is needed
+            shutil.copy2(source, partial)
+
+            # Verify copy if requested
+            if verify and original_checksum:
+                new_checksum = self._calculate_checksum(partial)
+                if original_checksum != new_checksum:
+                    raise ValueError("Copy verification failed: checksums don't match")
+
+            if durable:
+                fd = os.open(partial, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+            self._publish(partial, target)
+        finally:
+            # Remove the temporary name (or the corrupted copy on failure)
+            partial.unlink(missing_ok=True)
+
+    def _publish(self, partial: Path, target: Path) -> None:
+        """Atomically give a completed file its final name without overwriting"""
+        try:
+            # link() fails if the target exists, so a concurrent file is never replaced
+            os.link(partial, target)
+        except FileExistsError:
+            raise
+        except OSError:
+            # Filesystems without hard links (e.g. FAT/exFAT drives)
+            if target.exists():
+                raise FileExistsError(f"Target already exists: {target}")
+            os.rename(partial, target)
+
     def safe_rename(self, source: Path, target: Path, verify: bool = True) -> bool:
         """Safely rename file in same directory with optional verification"""
         try:
@@ -95,20 +144,35 @@ class FileOperations:
                 self.logger.info(f"DRY RUN: Would rename {source} -> {target}")
                 return True
 
-            # Get original checksum if verification is enabled
-            original_checksum = None
-            if verify:
-                original_checksum = self._calculate_checksum(source)
-
-            # Use Python's rename which is atomic on most filesystems
-            source.rename(target)
+            # A rename moves the directory entry, never the data, so verification
+            # checks that the target is the same inode instead of hashing the
+            # file before and after
+            original_stat = os.stat(source) if verify else None
+
+            # rename() silently replaces an existing target on POSIX; link() fails
+            # instead, so a file that appeared since the conflict check survives
+            try:
+                os.link(source, target)
+            except FileExistsError:
+                raise
+            except OSError:
+                # Filesystems without hard links (e.g. FAT/exFAT drives)
+                if target.exists():
+                    raise FileExistsError(f"Target already exists: {target}")
+                source.rename(target)
+            else:
+                os.unlink(source)
 
             # Verify rename if requested
-            if verify and original_checksum:
-                new_checksum = self._calculate_checksum(target)
-                if original_checksum != new_checksum:
+            if original_stat is not None:
+                new_stat = os.stat(target)
+                if (new_stat.st_dev, new_stat.st_ino, new_stat.st_size) != (
+                    original_stat.st_dev, original_stat.st_ino, original_stat.st_size
+                ):
                     # This shouldn't happen with atomic rename, but check anyway
-                    raise ValueError("Rename verification failed: checksums don't match")
+                    raise ValueError(
+                        "Rename verification failed: target is not the renamed file"
+                    )
 
             self.logger.debug(f"Successfully renamed: {source} -> {target}")
             return True
@@ -117,24 +181,53 @@ class FileOperations:
             self.logger.error(f"Rename failed {source} -> {target}: {e}")
             return False
 
-    def _calculate_checksum(self, file_path: Path, algorithm: str = 'sha256') -> str:
-        """Calculate file checksum"""
-        if algorithm == 'sha256':
-            hash_obj = hashlib.sha256()
-        elif algorithm == 'md5':
-            hash_obj = hashlib.md5()
-        else:
+    def _calculate_checksum(
+        self, file_path: Path, algorithm: Optional[str] = None
+    ) -> str:
+        """Calculate file checksum, using the configured algorithm by default"""
+        if algorithm is None:
+            algorithm = self.config.hash_algorithm
+
+        if algorithm not in ('blake2b', 'sha256', 'md5'):
             raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+        hash_obj = hashlib.new(algorithm, usedforsecurity=False)
 
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hash_obj.update(chunk)
+            # Read into one reusable buffer instead of allocating bytes per chunk
+            buffer = bytearray(1024 * 1024)
+            view = memoryview(buffer)
+            with open(self._open_for_hashing(file_path), 'rb', buffering=0) as f:
+                while n := f.readinto(buffer):
+                    hash_obj.update(view[:n])
             return hash_obj.hexdigest()
         except Exception as e:
             self.logger.error(f"Checksum calculation failed for {file_path}: {e}")
             raise
 
+    @staticmethod
+    def _open_for_hashing(file_path: Path) -> int:
+        """Open a file descriptor for a sequential read-only pass
+
+        Uses O_NOATIME where available so that verification reads don't cause
+        inode writes, and hints sequential access to the kernel readahead.
+        """
+        flags = os.O_RDONLY
+        noatime = getattr(os, 'O_NOATIME', 0)
+        try:
+            fd = os.open(file_path, flags | noatime)
+        except PermissionError:
+            # O_NOATIME is only permitted on files we own
+            if not noatime:
+                raise
+            fd = os.open(file_path, flags)
+
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        return fd
+
     def verify_file_integrity(self, file_path: Path, expected_checksum: str,
                             algorithm: str = 'sha256') -> bool:
         """Verify file integrity against expected checksum"""
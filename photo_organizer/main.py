@@ -8,8 +8,6 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 
-from .organizer import PhotoOrganizer
-from .config import Config
 from .logger import setup_logger
 
 
@@ -67,7 +65,13 @@ from .logger import setup_logger
     "--rescan",
     is_flag=True,
     default=False,
-    help="Force rescan of drives (ignore existing scan data)",
+    help="Rescan drives, hashing only files added or modified since the last scan",
+)
+@click.option(
+    "--full-rescan",
+    is_flag=True,
+    default=False,
+    help="Rescan drives from scratch, hashing every file again",
 )
 @click.option(
     "--backup-to-drives",
@@ -86,6 +90,7 @@ def main(
     compare_drives: tuple,
     sync_drives: tuple,
     rescan: bool,
+    full_rescan: bool,
     backup_to_drives: List[str],
 ) -> int:
     """Organize photos by renaming based on EXIF data and optionally moving to date-based folders.
@@ -101,7 +106,7 @@ def main(
     - Use --compare-drives to analyze differences between backup drives
     - Use --sync-drives to automatically copy missing files between drives
     - Use --backup-to-drives to backup local archive to one or more backup drives
-    - Use --rescan to force fresh scanning of drives
+    - Use --rescan to update drive scans, or --full-rescan to rehash every file
 
     Use 'photo-organizer config --help' to manage per-directory configurations.
     """
@@ -114,7 +119,13 @@ def main(
         from .drive_comparison import compare_backup_drives
 
         drive1, drive2 = compare_drives
-        compare_backup_drives(Path(drive1), Path(drive2), logger, force_rescan=rescan)
+        compare_backup_drives(
+            Path(drive1),
+            Path(drive2),
+            logger,
+            force_rescan=full_rescan,
+            rescan=rescan,
+        )
         return 0
 
     # Handle drive synchronization
@@ -123,7 +134,12 @@ def main(
 
         drive1, drive2 = sync_drives
         success = sync_backup_drives(
-            Path(drive1), Path(drive2), logger, force_rescan=rescan, dry_run=dry_run
+            Path(drive1),
+            Path(drive2),
+            logger,
+            force_rescan=full_rescan,
+            dry_run=dry_run,
+            rescan=rescan,
         )
         return 0 if success else 1
 
@@ -138,6 +154,7 @@ def main(
             logger=logger,
             dry_run=dry_run,
             rescan=rescan,
+            force_rescan=full_rescan,
         )
         return 0 if success else 1
 
@@ -149,6 +166,11 @@ def main(
         )
         return 1
 
+    # Imported here so the drive management commands don't load the organizer
+    # and its EXIF dependencies
+    from .config import Config
+    from .organizer import PhotoOrganizer
+
     # Create configuration
     config = Config(
         output_dir=output,
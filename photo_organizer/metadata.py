@@ -1,53 +1,241 @@
 """EXIF metadata extraction using Python libraries"""
 
+from collections import OrderedDict
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Set, Tuple
 import logging
+import os
+import re
+import sqlite3
+import threading
 
-try:
-    from PIL import Image
-    from PIL.ExifTags import TAGS
-    PILLOW_AVAILABLE = True
-except ImportError:
-    PILLOW_AVAILABLE = False
-
-try:
-    import exifread
-    EXIFREAD_AVAILABLE = True
-except ImportError:
-    EXIFREAD_AVAILABLE = False
+# Only check that the libraries are installed here; they are imported on first
+# use so that commands which never read EXIF data don't pay for loading them
+PILLOW_AVAILABLE = find_spec("PIL") is not None
+EXIFREAD_AVAILABLE = find_spec("exifread") is not None
 
 
 class MetadataExtractor:
     """Extract metadata from image files using available Python libraries"""
 
-    def __init__(self) -> None:
+    # Standard EXIF dates ("2023:12:25 14:30:45"), their dash variant and the
+    # date-only forms, parsed in one match instead of trying strptime formats
+    _EXIF_DATE_RE = re.compile(
+        r"(\d{4})([:-])(\d{2})\2(\d{2})(?: (\d{2}):(\d{2}):(\d{2}))?"
+    )
+
+    # Leading bytes of the containers Pillow or exifread can read EXIF from:
+    # JPEG, PNG, TIFF (also CR2/NEF/ARW/DNG), Panasonic and Olympus raw, Fujifilm RAF
+    _IMAGE_SIGNATURES = (
+        b"\xff\xd8\xff",
+        b"\x89PNG\r\n\x1a\n",
+        b"II*\x00",
+        b"MM\x00*",
+        b"IIU\x00",
+        b"IIRO",
+        b"IIRS",
+        b"FUJIFILM",
+    )
+
+    # Dates kept in memory, least recently used first out
+    CACHE_MAXSIZE = 4096
+
+    def __init__(self, cache_path: Optional[Path] = None) -> None:
+        """Initialize extractor
+
+        Args:
+            cache_path: Optional SQLite file persisting extracted dates between
+                runs, keyed by device, inode, mtime and size of each file
+        """
         self.logger = logging.getLogger('photo_organizer.metadata')
 
+        self.cache_path = cache_path
+        self._cache: "OrderedDict[str, datetime]" = OrderedDict()
+        self._cache_lock = threading.Lock()  # Dates are extracted from worker threads
+
+        # Changes to the cache database, written together by flush_cache()
+        self._pending_dates: Dict[str, str] = {}
+        self._stale_keys: Set[str] = set()
+        # Cache key of each file looked up, so forget() works after it is gone
+        self._keys_by_path: Dict[str, str] = {}
+        # Connection for looking up dates missing from memory, opened on first
+        # use and closed by flush_cache()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if cache_path is not None:
+            self._init_cache_db(cache_path)
+
         if not PILLOW_AVAILABLE and not EXIFREAD_AVAILABLE:
             self.logger.warning("Neither Pillow nor exifread available. Install one for EXIF support.")
 
-    def get_creation_date(self, file_path: Path) -> Optional[datetime]:
-        """Extract creation date from image EXIF data"""
+        # Extraction methods in order of preference, resolved once per instance
+        # rather than on every file. The filesystem date is always the fallback.
+        self._methods: Tuple[Callable[[Path], Optional[datetime]], ...] = tuple(
+            method for available, method in (
+                (PILLOW_AVAILABLE, self._get_date_with_pillow),
+                (EXIFREAD_AVAILABLE, self._get_date_with_exifread),
+                (True, self._get_date_from_filesystem),
+            ) if available
+        )
+
+    def _init_cache_db(self, cache_path: Path) -> None:
+        """Create the date cache database if needed
+
+        Entries are not loaded up front; _lookup_cached_date() reads the
+        ones for the files actually processed.
+        """
+        try:
+            conn = sqlite3.connect(cache_path)
+            try:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS creation_dates (
+                        file_key TEXT PRIMARY KEY,
+                        creation_date TEXT
+                    )
+                """)
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as e:
+            self.logger.warning(f"Could not open creation date cache {cache_path}: {e}")
+            self.cache_path = None
 
-        # Try multiple methods in order of preference
-        methods = []
+    def _lookup_cached_date(self, file_key: str) -> Optional[datetime]:
+        """Read a date missing from memory from the cache database"""
+        if self.cache_path is None:
+            return None
+        try:
+            with self._db_lock:
+                if self._db is None:
+                    self._db = sqlite3.connect(
+                        self.cache_path, check_same_thread=False
+                    )
+                row = self._db.execute(
+                    "SELECT creation_date FROM creation_dates WHERE file_key = ?",
+                    (file_key,),
+                ).fetchone()
+        except Exception as e:
+            self.logger.debug(f"Could not read cached creation date: {e}")
+            return None
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def _cache_key(self, file_path: Path) -> Optional[str]:
+        """Build the cache key for a file, which changes whenever the file does"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return f"{st.st_dev}:{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+
+    def _store_cached_date(self, file_key: str, date: datetime) -> None:
+        """Remember an extracted date, queueing it for the cache database"""
+        with self._cache_lock:
+            self._remember(file_key, date)
+            if self.cache_path is not None:
+                self._pending_dates[file_key] = date.isoformat()
+                self._stale_keys.discard(file_key)
+
+    def _remember(self, file_key: str, date: datetime) -> None:
+        """Add a date to the in-memory cache, evicting the oldest past the bound
+
+        Must be called with _cache_lock held.
+        """
+        self._cache[file_key] = date
+        self._cache.move_to_end(file_key)
+        if len(self._cache) > self.CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+
+    def forget(self, file_path: Path) -> None:
+        """Drop the cached date of a file that no longer exists, e.g. after a move"""
+        with self._cache_lock:
+            file_key = self._keys_by_path.pop(str(file_path), None)
+            if file_key is None:
+                return
+            self._cache.pop(file_key, None)
+            if self.cache_path is not None:
+                self._pending_dates.pop(file_key, None)
+                self._stale_keys.add(file_key)
+
+    def flush_cache(self) -> None:
+        """Write queued cache changes to the cache database in one transaction
+
+        Also ends the current run: the lookup connection is closed and the
+        per-file keys kept for forget() are dropped.
+        """
+        with self._cache_lock:
+            pending, self._pending_dates = self._pending_dates, {}
+            stale, self._stale_keys = self._stale_keys, set()
+            self._keys_by_path.clear()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+        if self.cache_path is None or not (pending or stale):
+            return
 
-        if PILLOW_AVAILABLE:
-            methods.append(self._get_date_with_pillow)
+        try:
+            conn = sqlite3.connect(self.cache_path)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO creation_dates "
+                        "(file_key, creation_date) VALUES (?, ?)",
+                        pending.items(),
+                    )
+                    conn.executemany(
+                        "DELETE FROM creation_dates WHERE file_key = ?",
+                        ((file_key,) for file_key in stale),
+                    )
+            finally:
+                conn.close()
+        except Exception as e:
+            self.logger.debug(f"Could not store cached creation dates: {e}")
+
+    def _get_cached_date(self, file_path: Path, file_key: str) -> Optional[datetime]:
+        """Return a file's date from memory or, failing that, the cache database"""
+        with self._cache_lock:
+            cached = self._cache.get(file_key)
+            if cached is not None:
+                self._cache.move_to_end(file_key)
+            if self.cache_path is not None:
+                self._keys_by_path[str(file_path)] = file_key
+        if cached is None:
+            cached = self._lookup_cached_date(file_key)
+            if cached is not None:
+                with self._cache_lock:
+                    self._remember(file_key, cached)
+        return cached
 
-        if EXIFREAD_AVAILABLE:
-            methods.append(self._get_date_with_exifread)
+    def get_creation_date(self, file_path: Path) -> Optional[datetime]:
+        """Extract creation date from image EXIF data"""
 
-        # Fallback to file system date
-        methods.append(self._get_date_from_filesystem)
+        # Dates are memoized in memory for every extractor; cache_path only adds
+        # persistence between runs
+        file_key = self._cache_key(file_path)
+        if file_key is not None:
+            cached = self._get_cached_date(file_path, file_key)
+            if cached is not None:
+                self.logger.debug(
+                    f"Using cached creation date for {file_path.name}: {cached}"
+                )
+                return cached
+
+        methods = self._methods
+        if not self._has_image_signature(file_path):
+            # Not a container with EXIF data, so don't have the libraries parse it
+            methods = (self._get_date_from_filesystem,)
 
         for method in methods:
             try:
                 date = method(file_path)
                 if date:
                     self.logger.debug(f"Got creation date for {file_path.name}: {date}")
+                    if file_key is not None:
+                        self._store_cached_date(file_key, date)
                     return date
             except Exception as e:
                 self.logger.debug(f"Method {method.__name__} failed for {file_path}: {e}")
@@ -56,27 +244,51 @@ class MetadataExtractor:
         self.logger.warning(f"Could not extract creation date from {file_path}")
         return None
 
+    def _has_image_signature(self, file_path: Path) -> bool:
+        """Check the first bytes of a file for a known image container"""
+        try:
+            with open(file_path, 'rb', buffering=0) as f:
+                head = f.read(12)
+        except OSError:
+            # Let the extraction methods report the problem
+            return True
+
+        # HEIF/HEIC/AVIF and WebP are identified by a tag after a size field
+        return (
+            head.startswith(self._IMAGE_SIGNATURES)
+            or head[4:8] == b"ftyp"
+            or (head[:4] == b"RIFF" and head[8:12] == b"WEBP")
+        )
+
     def _get_date_with_pillow(self, file_path: Path) -> Optional[datetime]:
         """Extract date using Pillow/PIL"""
         if not PILLOW_AVAILABLE:
             return None
 
         try:
+            from PIL import Image
+            from PIL.ExifTags import TAGS
+
             with Image.open(file_path) as img:
                 exifdata = img.getexif()
 
+                # Map tag names to values in a single pass over the EXIF entries
+                name_to_value = {
+                    TAGS.get(tag_id, tag_id): tag_value
+                    for tag_id, tag_value in exifdata.items()
+                }
+
                 # Common EXIF date tags in order of preference
-                date_tags = [
+                date_tags = (
                     'DateTimeOriginal',    # Camera shooting date
                     'DateTimeDigitized',   # Date digitized
                     'DateTime'             # Date modified
-                ]
+                )
 
                 for tag_name in date_tags:
-                    for tag_id, tag_value in exifdata.items():
-                        tag_key = TAGS.get(tag_id, tag_id)
-                        if tag_key == tag_name and tag_value:
-                            return self._parse_exif_date(tag_value)
+                    tag_value = name_to_value.get(tag_name)
+                    if tag_value:
+                        return self._parse_exif_date(tag_value)
 
         except Exception as e:
             self.logger.debug(f"Pillow extraction failed: {e}")
@@ -89,6 +301,8 @@ class MetadataExtractor:
             return None
 
         try:
+            import exifread
+
             with open(file_path, 'rb') as f:
                 tags = exifread.process_file(f)
 
@@ -124,7 +338,24 @@ class MetadataExtractor:
             # EXIF date format: "2023:12:25 14:30:45"
             date_string = str(date_string).strip()
 
-            # Common EXIF date formats
+            match = self._EXIF_DATE_RE.fullmatch(date_string)
+            if match:
+                year, _, month, day, hour, minute, second = match.groups(default="0")
+                try:
+                    return datetime(
+                        int(year),
+                        int(month),
+                        int(day),
+                        int(hour),
+                        int(minute),
+                        int(second),
+                    )
+                except ValueError:
+                    # Out-of-range fields, e.g. "0000:00:00 00:00:00" from some cameras
+                    self.logger.debug(f"Could not parse date string: {date_string}")
+                    return None
+
+            # Less common spellings, e.g. single-digit fields
             formats = [
                 '%Y:%m:%d %H:%M:%S',  # Standard EXIF format
                 '%Y-%m-%d %H:%M:%S',  # Alternative format
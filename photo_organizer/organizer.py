@@ -1,29 +1,88 @@
 """Core photo organizer with safety-first approach"""
 
 import hashlib
+import mmap
+import os
+import re
 import sqlite3
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Any, List
+from typing import Deque, Dict, Iterator, Optional, Set, Tuple, List
 import logging
 
 from .config import Config
 from .metadata import MetadataExtractor
-from .file_utils import FileOperations
+from .file_utils import FileOperations, content_sha256
+
+
+@dataclass(slots=True)
+class FileResult:
+    """Outcome of processing a single file"""
+
+    success: bool = False
+    action: str = 'skipped'  # moved, copied, renamed, dry_run or skipped
+    reason: str = ''  # Why the file was skipped or failed
+    target_path: Optional[str] = None
+    checksum: Optional[str] = None
+
+
+@dataclass(slots=True)
+class _InspectedFile:
+    """Source file details gathered once and shared by the processing stages"""
+
+    checksum: str
+    size: int
+    creation_date: datetime
 
 
 class PhotoOrganizer:
     """Main photo organizer class with safety features"""
 
+    # Processed-file records written per transaction during process_directory
+    MARK_BATCH_SIZE = 500
+
+    # Files larger than this are hashed from a memory map instead of read()
+    MMAP_HASH_THRESHOLD = 16 << 20
+
+    # A YEAR/YEAR-MM (or YEAR/YEAR_MM) directory pair somewhere above the file
+    _ARCHIVE_STRUCTURE_RE = re.compile(r"(?:^|[\\/])(\d{4})[\\/]\1[-_]\d{2}[\\/]")
+
     def __init__(self, config: Config, logger: logging.Logger) -> None:
         self.config = config
         self.logger = logger
-        self.metadata_extractor = MetadataExtractor()
         self.file_ops = FileOperations(config, logger)
 
         # Track processed files to avoid reprocessing
         self.processed_files_db = self._init_processed_db()
 
+        # Creation dates are cached next to the processed files database; a dry
+        # run only memoizes them, so it writes nothing to the output directory
+        date_cache_path = None
+        if not self.config.dry_run:
+            date_cache_path = self.config.output_dir / ".photo_organizer_cache.sqlite"
+        self.metadata_extractor = MetadataExtractor(cache_path=date_cache_path)
+
+        # Names present in each target directory, listed once per directory and
+        # kept up to date as files are placed. Only used for the duration of a
+        # process_directory call, so changes made between runs are always seen.
+        self._dir_listings: Optional[Dict[str, Set[str]]] = None
+
+        # Checksums of the files placed during the current process_directory
+        # call, so a later name conflict with one of them needs no re-hash
+        self._placed_checksums: Optional[Dict[str, str]] = None
+
+        # Processed-file records waiting to be written in one transaction, only
+        # collected during process_directory (None writes each record at once)
+        self._pending_marks: Optional[List[Tuple[str, str, str, str, int]]] = None
+
+        # Processed-file records read with one query at the start of
+        # process_directory, instead of one query per inspected file
+        self._processed_index: Optional[Dict[str, Tuple[str, str]]] = None
+
     def _init_processed_db(self) -> Path:
         """Initialize SQLite database to track processed files"""
         db_path = self.config.output_dir / ".photo_organizer_db.sqlite"
@@ -32,6 +91,8 @@ class PhotoOrganizer:
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
         conn = sqlite3.connect(db_path)
+        # WAL lets the inspecting worker threads read while records are written
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS processed_files (
                 original_path TEXT PRIMARY KEY,
@@ -48,26 +109,54 @@ class PhotoOrganizer:
 
     def _get_file_checksum(self, file_path: Path) -> str:
         """Calculate SHA-256 checksum of file"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return self._get_file_checksum_and_size(file_path)[0]
 
-    def _is_already_processed(self, file_path: Path) -> Tuple[bool, Optional[str]]:
-        """Check if file was already processed by comparing checksum"""
-        if not file_path.exists():
-            return False, None
+    def _get_file_checksum_and_size(self, file_path: Path) -> Tuple[str, int]:
+        """Calculate SHA-256 checksum and size of file from a single open()
 
-        current_checksum = self._get_file_checksum(file_path)
+        The size comes from fstat() on the open descriptor, so it always
+        describes the same file that was hashed.
+        """
+        with open(file_path, "rb", buffering=0) as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size <= self.MMAP_HASH_THRESHOLD:
+                # Small files are cheaper to read than to map; file_digest still
+                # reads and hashes them entirely in C
+                return hashlib.file_digest(f, content_sha256).hexdigest(), file_size
 
-        conn = sqlite3.connect(self.processed_files_db)
-        cursor = conn.execute(
-            "SELECT new_path, original_checksum FROM processed_files WHERE original_path = ?",
-            (str(file_path),)
-        )
-        result = cursor.fetchone()
-        conn.close()
+            try:
+                # Hash the pages straight from a memory map instead of copying
+                # every chunk into a bytes object first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    sha256_hash = hashlib.sha256(mm, usedforsecurity=False)
+            except (ValueError, OSError):
+                # Some special files cannot be mapped
+                f.seek(0)
+                sha256_hash = hashlib.file_digest(f, content_sha256)
+        return sha256_hash.hexdigest(), file_size
+
+    def _is_already_processed(
+        self, file_path: Path, current_checksum: Optional[str] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """Check if file was already processed by comparing checksum"""
+        if current_checksum is None:
+            if not file_path.exists():
+                return False, None
+            current_checksum = self._get_file_checksum(file_path)
+
+        result: Optional[Tuple[str, str]]
+        if self._processed_index is not None:
+            result = self._processed_index.get(str(file_path))
+        else:
+            conn = sqlite3.connect(self.processed_files_db)
+            cursor = conn.execute(
+                "SELECT new_path, original_checksum FROM processed_files WHERE original_path = ?",
+                (str(file_path),)
+            )
+            result = cursor.fetchone()
+            conn.close()
 
         if result:
             stored_new_path, stored_checksum = result
@@ -79,64 +168,238 @@ class PhotoOrganizer:
 
         return False, None
 
-    def _mark_as_processed(self, original_path: Path, checksum: str, new_path: Path, file_size: int):
-        """Mark file as processed in database"""
+    def _has_processed_record(self, file_path: Path) -> bool:
+        """Check if the processed-files database has a record for this path"""
+        if self._processed_index is not None:
+            return str(file_path) in self._processed_index
+
         conn = sqlite3.connect(self.processed_files_db)
-        conn.execute("""
-            INSERT OR REPLACE INTO processed_files
-            (original_path, original_checksum, new_path, processed_at, file_size)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
+        try:
+            return conn.execute(
+                "SELECT 1 FROM processed_files WHERE original_path = ?",
+                (str(file_path),)
+            ).fetchone() is not None
+        finally:
+            conn.close()
+
+    def _load_processed_index(self) -> Dict[str, Tuple[str, str]]:
+        """Read all processed-file records, keyed by original path"""
+        conn = sqlite3.connect(self.processed_files_db)
+        try:
+            return {
+                original_path: (new_path, checksum)
+                for original_path, new_path, checksum in conn.execute(
+                    "SELECT original_path, new_path, original_checksum "
+                    "FROM processed_files"
+                )
+            }
+        finally:
+            conn.close()
+
+    def iter_recently_processed(self, since: datetime) -> Iterator[Path]:
+        """Yield the target paths of files processed after the given time
+
+        Reads the processed-files records, so verifying a run does not need
+        to walk and re-hash the whole archive.
+        """
+        conn = sqlite3.connect(self.processed_files_db)
+        try:
+            # processed_at is an ISO timestamp, which sorts chronologically
+            rows = conn.execute(
+                "SELECT new_path FROM processed_files WHERE processed_at > ? "
+                "ORDER BY processed_at",
+                (since.isoformat(),)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        for (new_path,) in rows:
+            yield Path(new_path)
+
+    def _mark_as_processed(
+        self, original_path: Path, checksum: str, new_path: Path, file_size: int
+    ) -> None:
+        """Mark file as processed in database"""
+        record = (
             str(original_path),
             checksum,
             str(new_path),
             datetime.now().isoformat(),
             file_size
-        ))
-        conn.commit()
-        conn.close()
+        )
+
+        if self._pending_marks is None:
+            self._write_marks([record])
+            return
+
+        self._pending_marks.append(record)
+        if len(self._pending_marks) >= self.MARK_BATCH_SIZE:
+            self._flush_marks()
+
+    def _flush_marks(self) -> None:
+        """Write the collected processed-file records"""
+        if self._pending_marks:
+            self._write_marks(self._pending_marks)
+            self._pending_marks.clear()
+
+    def _write_marks(self, records: List[Tuple[str, str, str, str, int]]) -> None:
+        """Write processed-file records in a single transaction"""
+        conn = sqlite3.connect(self.processed_files_db)
+        try:
+            # One commit (and sync) per batch rather than per file
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                # Upsert updates a reprocessed file's row in place; INSERT OR
+                # REPLACE would delete and re-insert it
+                conn.executemany("""
+                    INSERT INTO processed_files
+                    (original_path, original_checksum, new_path, processed_at,
+                     file_size)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(original_path) DO UPDATE SET
+                        original_checksum = excluded.original_checksum,
+                        new_path = excluded.new_path,
+                        processed_at = excluded.processed_at,
+                        file_size = excluded.file_size
+                """, records)
+        finally:
+            conn.close()
 
     def _generate_target_path(self, original_path: Path, creation_date: datetime) -> Path:
         """Generate target path based on creation date"""
+        # Format from the datetime fields directly, strftime is much slower
+        d = creation_date
+
         # Create filename: YYYY-MM-DD_HH-MM-SS.ext
-        filename = creation_date.strftime("%Y-%m-%d_%H-%M-%S") + original_path.suffix.lower()
+        filename = (
+            f"{d.year:04d}-{d.month:02d}-{d.day:02d}_"
+            f"{d.hour:02d}-{d.minute:02d}-{d.second:02d}{original_path.suffix.lower()}"
+        )
 
         if self.config.rename_only:
             # Rename in place - same directory as original
-            return original_path.parent / filename
+            return original_path.with_name(filename)
         else:
-            # Move to archive structure
-            year = creation_date.strftime("%Y")
-            month = creation_date.strftime("%m")
-            target_dir = self.config.output_dir / f"{year}" / f"{year}_{month}"
-            return target_dir / filename
+            # Move to archive structure; join the strings and build a single Path
+            # rather than one per "/" step
+            return Path(os.path.join(
+                self.config.output_dir,
+                f"{d.year:04d}",
+                f"{d.year:04d}_{d.month:02d}",
+                filename,
+            ))
+
+    def _existing_names(self, directory: Path) -> Set[str]:
+        """Return the names in a directory, from the listing cache when active"""
+        directory_str = str(directory)
+        if self._dir_listings is not None:
+            cached = self._dir_listings.get(directory_str)
+            if cached is not None:
+                return cached
+
+        try:
+            with os.scandir(directory_str) as entries:
+                names = {entry.name for entry in entries}
+        except FileNotFoundError:
+            names = set()
+
+        if self._dir_listings is not None:
+            self._dir_listings[directory_str] = names
+        return names
+
+    def _record_placement(
+        self, source_path: Path, target_path: Path, checksum: Optional[str] = None
+    ) -> None:
+        """Update cached directory listings and checksums after a file was placed"""
+        if self._placed_checksums is not None and checksum is not None:
+            self._placed_checksums[str(target_path)] = checksum
+
+        if self._dir_listings is None:
+            return
+
+        target_names = self._dir_listings.get(str(target_path.parent))
+        if target_names is not None:
+            target_names.add(target_path.name)
+
+        if not self.config.copy_mode:
+            source_names = self._dir_listings.get(str(source_path.parent))
+            if source_names is not None:
+                source_names.discard(source_path.name)
 
     def _find_safe_target_path(self, target_path: Path) -> Path:
         """Find a safe target path that doesn't overwrite existing files"""
-        if not target_path.exists():
-            return target_path
+        parent = target_path.parent
+
+        if self._dir_listings is None:
+            # Outside process_directory a single probe answers the common case
+            if not target_path.exists():
+                return target_path
+            existing = self._existing_names(parent)
+        else:
+            # List the directory once instead of probing every candidate name
+            existing = self._existing_names(parent)
+            if target_path.name not in existing:
+                return target_path
 
         # File exists, generate incremental names
         stem = target_path.stem
         suffix = target_path.suffix
-        parent = target_path.parent
 
         for i in range(1, self.config.max_duplicate_suffix + 1):
-            candidate = parent / f"{stem}_{i:03d}{suffix}"
-            if not candidate.exists():
-                return candidate
+            candidate = f"{stem}_{i:03d}{suffix}"
+            if candidate not in existing:
+                return parent / candidate
 
         # If we reach here, we've exceeded max duplicates
         raise ValueError(f"Too many duplicates for {target_path}")
 
-    def _handle_existing_file(self, source_path: Path, target_path: Path) -> Tuple[bool, str]:
+    @staticmethod
+    def _read_head(file_path: Path, size: int = 4096) -> bytes:
+        """Read the first block of a file for a cheap content comparison"""
+        with open(file_path, "rb", buffering=0) as f:
+            return f.read(size)
+
+    def _handle_existing_file(
+        self,
+        source_path: Path,
+        target_path: Path,
+        source_checksum: Optional[str] = None,
+        source_size: Optional[int] = None,
+    ) -> Tuple[bool, str]:
         """Handle case where target file already exists"""
-        if not target_path.exists():
+        # Most targets are new; during a run the directory listing answers that
+        # without a stat, otherwise the stat below does
+        if (
+            self._dir_listings is not None
+            and target_path.name not in self._existing_names(target_path.parent)
+        ):
+            return True, "no_conflict"
+
+        try:
+            target_size = target_path.stat().st_size
+        except FileNotFoundError:
             return True, "no_conflict"
 
+        if source_size is None:
+            source_size = source_path.stat().st_size
+
+        # Files of different size cannot be duplicates, no need to hash them
+        if source_size != target_size:
+            self.logger.info(f"File name conflict but different content: {target_path.name}")
+            return True, "name_conflict"
+
         # Compare checksums to detect true duplicates
-        source_checksum = self._get_file_checksum(source_path)
-        target_checksum = self._get_file_checksum(target_path)
+        target_checksum = None
+        if self._placed_checksums is not None:
+            target_checksum = self._placed_checksums.get(str(target_path))
+        if target_checksum is None:
+            # Differing first blocks rule out a duplicate without hashing the target
+            if self._read_head(source_path) != self._read_head(target_path):
+                self.logger.info(f"File name conflict but different content: {target_path.name}")
+                return True, "name_conflict"
+            target_checksum = self._get_file_checksum(target_path)
+        if source_checksum is None:
+            source_checksum = self._get_file_checksum(source_path)
 
         if source_checksum == target_checksum:
             self.logger.info(f"Duplicate file detected: {source_path.name} == {target_path.name}")
@@ -146,61 +409,103 @@ class PhotoOrganizer:
         self.logger.info(f"File name conflict but different content: {target_path.name}")
         return True, "name_conflict"
 
-    def process_file(self, file_path: Path) -> Dict[str, Any]:
+    def process_file(self, file_path: Path) -> FileResult:
         """Process a single file safely"""
-        result = {
-            'success': False,
-            'action': 'skipped',
-            'reason': '',
-            'original_path': str(file_path),
-            'target_path': None,
-            'checksum': None
-        }
+        result, inspected = self._inspect_file(file_path)
+        if inspected is None:
+            self.metadata_extractor.flush_cache()
+            return result
+
+        result = self._apply_file(file_path, result, inspected)
+        self.metadata_extractor.flush_cache()
+        return result
+
+    def _inspect_file(
+        self, file_path: Path
+    ) -> Tuple[FileResult, Optional[_InspectedFile]]:
+        """Read-only first stage of processing a file
+
+        Returns the result along with the inspected file details, which are
+        None when the file should be skipped (the result then carries the
+        reason). This stage never modifies the filesystem, so process_directory
+        runs it on worker threads.
+        """
+        result = FileResult()
 
         try:
             # Skip if not supported extension
             if not self.config.is_supported_extension(file_path):
-                result['reason'] = 'unsupported_extension'
-                return result
+                result.reason = 'unsupported_extension'
+                return result, None
+
+            # Skip if file is already in archive structure; a path match is far
+            # cheaper than the hash below, so it is checked first. Only a file
+            # with a processed record may still count as already processed,
+            # which takes precedence as it always has.
+            in_archive = self._is_in_archive_structure(file_path)
+            if in_archive and not self._has_processed_record(file_path):
+                result.reason = 'already_in_archive'
+                return result, None
+
+            # Stat and hash the source once; both are reused by the later checks
+            # and the database record instead of probing the file again
+            checksum, file_size = self._get_file_checksum_and_size(file_path)
 
             # Check if already processed
-            already_processed, previous_target = self._is_already_processed(file_path)
+            already_processed, previous_target = self._is_already_processed(
+                file_path, checksum
+            )
             if already_processed:
-                result['reason'] = 'already_processed'
-                result['target_path'] = previous_target
-                return result
+                result.reason = 'already_processed'
+                result.target_path = previous_target
+                return result, None
 
-            # Skip if file is already in archive structure
-            if self._is_in_archive_structure(file_path):
-                result['reason'] = 'already_in_archive'
-                return result
+            if in_archive:
+                result.reason = 'already_in_archive'
+                return result, None
 
             # Extract metadata to get creation date
             creation_date = self.metadata_extractor.get_creation_date(file_path)
             if not creation_date:
-                result['reason'] = 'no_creation_date'
-                return result
+                result.reason = 'no_creation_date'
+                return result, None
+
+            return result, _InspectedFile(checksum, file_size, creation_date)
+
+        except Exception as e:
+            self.logger.error(f"Error processing {file_path}: {e}")
+            result.reason = str(e)
+            return result, None
+
+    def _apply_file(
+        self, file_path: Path, result: FileResult, inspected: _InspectedFile
+    ) -> FileResult:
+        """Second stage of processing a file: resolve conflicts and move it
+
+        Must run serially, as conflict detection depends on the files placed
+        by earlier calls.
+        """
+        checksum = inspected.checksum
 
+        try:
             # Generate target path
-            target_path = self._generate_target_path(file_path, creation_date)
+            target_path = self._generate_target_path(file_path, inspected.creation_date)
 
             # Handle existing files
-            can_proceed, conflict_type = self._handle_existing_file(file_path, target_path)
+            can_proceed, conflict_type = self._handle_existing_file(
+                file_path, target_path, checksum, inspected.size
+            )
 
             if not can_proceed:
-                result['reason'] = conflict_type
-                result['target_path'] = str(target_path)
+                result.reason = conflict_type
+                result.target_path = str(target_path)
                 return result
 
             if conflict_type == "name_conflict":
                 target_path = self._find_safe_target_path(target_path)
 
-            result['target_path'] = str(target_path)
-
-            # Calculate checksum and get file size before operation
-            checksum = self._get_file_checksum(file_path)
-            file_size = file_path.stat().st_size  # Get size before moving the file
-            result['checksum'] = checksum
+            result.target_path = str(target_path)
+            result.checksum = checksum
 
             # Perform the operation (rename/move/copy) SAFELY
             if not self.config.dry_run:
@@ -208,54 +513,167 @@ class PhotoOrganizer:
                     success = self.file_ops.safe_rename(file_path, target_path, verify=self.config.verify_checksums)
                     if not success:
                         raise ValueError(f"Safe rename failed: {file_path} -> {target_path}")
-                    result['action'] = 'renamed'
+                    result.action = 'renamed'
                 elif self.config.copy_mode:
                     success = self.file_ops.safe_copy(file_path, target_path, verify=self.config.verify_checksums)
                     if not success:
                         raise ValueError(f"Safe copy failed: {file_path} -> {target_path}")
-                    result['action'] = 'copied'
+                    result.action = 'copied'
                 else:
                     success = self.file_ops.safe_move(file_path, target_path, verify=self.config.verify_checksums)
                     if not success:
                         raise ValueError(f"Safe move failed: {file_path} -> {target_path}")
-                    result['action'] = 'moved'
+                    result.action = 'moved'
+                    # The source inode is gone, so its cached date never hits again
+                    self.metadata_extractor.forget(file_path)
 
                 # Mark as processed only after successful operation
-                self._mark_as_processed(file_path, checksum, target_path, file_size)
+                self._mark_as_processed(
+                    file_path, checksum, target_path, inspected.size
+                )
+                self._record_placement(file_path, target_path, checksum)
             else:
-                result['action'] = 'dry_run'
+                result.action = 'dry_run'
 
-            result['success'] = True
+            result.success = True
 
         except Exception as e:
             self.logger.error(f"Error processing {file_path}: {e}")
-            result['reason'] = str(e)
+            result.reason = str(e)
 
         return result
 
+    @staticmethod
+    def _archive_prefix(archive_path: Path) -> str:
+        """Return the archive path as a string prefix ending in a separator"""
+        return os.path.join(os.fspath(archive_path), "")
+
+    @staticmethod
+    def _is_inside_archive_str(path_str: str, archive_prefix: str) -> bool:
+        """Check if a resolved path string lies under the archive prefix"""
+        return path_str.startswith(archive_prefix)
+
     def _is_inside_archive_dir(self, file_path: Path, archive_path: Path) -> bool:
-        """Check if file is inside the archive directory"""
+        """Check if file is inside the archive directory
+
+        Paths are normalized lexically with os.path.abspath rather than
+        Path.resolve(), so no filesystem lookups are made.
+        """
         try:
-            # Check if file_path is inside archive_path
-            return archive_path in file_path.parents or file_path == archive_path
+            file_path_str = os.path.abspath(file_path)
+            archive_str = os.path.abspath(archive_path)
+            archive_prefix = self._archive_prefix(Path(archive_str))
+            return (
+                self._is_inside_archive_str(file_path_str, archive_prefix)
+                or file_path_str == archive_str
+            )
         except Exception:
             return False
 
     def _is_in_archive_structure(self, file_path: Path) -> bool:
         """Check if file is already in the archive structure"""
         try:
-            # Check if path contains year/year-month pattern
-            parts = file_path.parts
-            for i, part in enumerate(parts[:-1]):  # Exclude filename
-                if part.isdigit() and len(part) == 4:  # Year
-                    if i + 1 < len(parts) - 1:  # Has next part
-                        next_part = parts[i + 1]
-                        if next_part.startswith(f"{part}-") and len(next_part) == 7:
-                            return True
-            return False
+            # Check if path contains year/year-month (or year_month) pattern
+            return self._ARCHIVE_STRUCTURE_RE.search(str(file_path)) is not None
         except Exception:
             return False
 
+    def _process_files_pipelined(
+        self, files: List[str]
+    ) -> Iterator[Tuple[Path, FileResult]]:
+        """Process files in order, inspecting upcoming files in the background
+
+        Hashing and EXIF reads for the next files overlap with the move of the
+        current one. Only a bounded window of files is inspected ahead, and
+        results are applied strictly in input order.
+        """
+        max_workers = self.config.max_workers or 1
+        prefetch = max_workers * 4  # Files inspected ahead of the current one
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            files_iter = map(Path, files)
+            pending: Deque[Tuple[Path, Future]] = deque(
+                (file_path, executor.submit(self._inspect_file, file_path))
+                for file_path in islice(files_iter, prefetch)
+            )
+
+            while pending:
+                file_path, future = pending.popleft()
+
+                next_file = next(files_iter, None)
+                if next_file is not None:
+                    pending.append(
+                        (next_file, executor.submit(self._inspect_file, next_file))
+                    )
+
+                result, inspected = future.result()
+                if inspected is not None:
+                    result = self._apply_file(file_path, result, inspected)
+
+                yield file_path, result
+
+    def _symlink_candidate(
+        self, entry: os.DirEntry, relative_dir: str, archive_prefix: str
+    ) -> Optional[str]:
+        """Return the path of a symlinked file to process, or None to skip it
+
+        Symlinked directories are not followed, but a symlinked file may still
+        point into the archive.
+        """
+        if not self.config.is_supported_extension(entry.name):
+            return None
+        file_path = os.path.join(relative_dir, entry.name)
+        try:
+            if not entry.is_file():
+                return None
+            if self._is_inside_archive_str(
+                os.path.realpath(entry.path), archive_prefix
+            ):
+                self.logger.debug(f"Skipping file inside archive directory: {file_path}")
+                return None
+        except OSError as e:
+            # If we can't resolve the path, include it to be safe
+            self.logger.warning(f"Could not resolve path for {file_path}: {e}")
+        return file_path
+
+    def _iter_candidates(
+        self, input_dir: Path, input_resolved: str, archive_path: Path
+    ) -> Iterator[str]:
+        """Yield supported files under input_dir, never descending into the archive
+
+        Walks the resolved input directory with os.scandir, whose entries carry
+        the file type from the directory listing, so only symlinks need a stat().
+        Yielded paths are plain strings relative to input_dir as given; Path
+        objects are only built for files that are actually processed.
+        """
+        archive_str = os.fspath(archive_path)
+        archive_prefix = self._archive_prefix(archive_path)
+
+        pending = [(input_resolved, os.fspath(input_dir))]
+        while pending:
+            directory, relative_dir = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_symlink():
+                            file_path = self._symlink_candidate(
+                                entry, relative_dir, archive_prefix
+                            )
+                            if file_path is not None:
+                                yield file_path
+                        elif entry.is_dir(follow_symlinks=False):
+                            # Prune the archive before descending; it may hold many
+                            # thousands of already organized files
+                            if entry.path != archive_str:
+                                pending.append(
+                                    (entry.path, os.path.join(relative_dir, entry.name))
+                                )
+                        elif entry.is_file(follow_symlinks=False):
+                            if self.config.is_supported_extension(entry.name):
+                                yield os.path.join(relative_dir, entry.name)
+            except OSError as e:
+                self.logger.warning(f"Could not read directory {directory}: {e}")
+
     def process_directory(self, input_dir: Path) -> Dict[str, int]:
         """Process all supported files in directory"""
         results = {
@@ -265,62 +683,77 @@ class PhotoOrganizer:
             'errors': 0
         }
 
-        # Find all supported files
-        files_to_process: List[Path] = []
-        for ext in self.config.extensions:
-            # Case-insensitive search
-            files_to_process.extend(input_dir.rglob(f"*.{ext}"))
-            files_to_process.extend(input_dir.rglob(f"*.{ext.upper()}"))
-
-        # Remove duplicates and sort
-        files_to_process = sorted(set(files_to_process))
-
-        # Filter out files that are inside the archive/output directory
+        # Resolve the archive and input directories once; the walk compares
+        # resolved path strings against them
         archive_path = self.config.output_dir.resolve()
-        filtered_files = []
-        for file_path in files_to_process:
-            try:
-                file_path_resolved = file_path.resolve()
-                # Check if file is inside the archive directory
-                if not self._is_inside_archive_dir(file_path_resolved, archive_path):
-                    filtered_files.append(file_path)
-                else:
-                    self.logger.debug(f"Skipping file inside archive directory: {file_path}")
-            except Exception as e:
-                self.logger.warning(f"Could not resolve path for {file_path}: {e}")
-                # If we can't resolve the path, include it to be safe
-                filtered_files.append(file_path)
+        input_resolved = os.fspath(input_dir.resolve())
 
-        files_to_process = filtered_files
+        # Find all supported files
+        files_to_process: List[str] = []
+        if self._is_inside_archive_dir(Path(input_resolved), archive_path):
+            self.logger.debug(
+                f"Input directory is inside the archive directory: {input_dir}"
+            )
+        else:
+            files_to_process.extend(
+                self._iter_candidates(input_dir, input_resolved, archive_path)
+            )
 
-        self.logger.info(f"Found {len(files_to_process)} files to process")
+        # Sort component-wise, matching the ordering of the equivalent Path objects
+        files_to_process.sort(key=lambda path_str: path_str.split(os.sep))
 
-        for i, file_path in enumerate(files_to_process, 1):
-            self.logger.debug(f"Processing ({i}/{len(files_to_process)}): {file_path.name}")
+        self.logger.info(f"Found {len(files_to_process)} files to process")
 
-            result = self.process_file(file_path)
+        # Targets are built under output_dir, so the archive-relative part used
+        # for logging is a plain string slice rather than a Path.relative_to() walk
+        output_prefix = self._archive_prefix(self.config.output_dir)
 
-            if result['success']:
-                if result['action'] in ['moved', 'copied', 'renamed', 'dry_run']:
-                    results['processed'] += 1
-                    action_msg = result['action'].replace('_', ' ').upper()
-                    target_path = Path(result['target_path'])
-                    if self.config.rename_only or result['action'] == 'renamed':
-                        # For rename only, show just the filename change
-                        self.logger.info(f"{action_msg}: {file_path.name} -> {target_path.name}")
-                    else:
-                        # Show relative path from archive root for clarity
-                        relative_target = target_path.relative_to(self.config.output_dir)
-                        self.logger.info(f"{action_msg}: {file_path.name} -> {relative_target}")
-            else:
-                if result['reason'] in ['duplicate', 'already_processed']:
-                    results['duplicates'] += 1
-                    self.logger.debug(f"SKIP ({result['reason']}): {file_path.name}")
-                elif result['reason'] in ['unsupported_extension', 'already_in_archive', 'no_creation_date']:
-                    results['skipped'] += 1
-                    self.logger.debug(f"SKIP ({result['reason']}): {file_path.name}")
+        self._dir_listings = {}
+        self._placed_checksums = {}
+        self._pending_marks = []
+        self._processed_index = self._load_processed_index()
+        try:
+            processed = self._process_files_pipelined(files_to_process)
+            for i, (file_path, result) in enumerate(processed, 1):
+                self.logger.debug(
+                    f"Processed ({i}/{len(files_to_process)}): {file_path.name}"
+                )
+
+                if result.success:
+                    if result.action in ['moved', 'copied', 'renamed', 'dry_run']:
+                        results['processed'] += 1
+                        action_msg = result.action.replace('_', ' ').upper()
+                        target_str = str(result.target_path)
+                        if self.config.rename_only or result.action == 'renamed':
+                            # For rename only, show just the filename change
+                            target_name = os.path.basename(target_str)
+                            self.logger.info(
+                                f"{action_msg}: {file_path.name} -> {target_name}"
+                            )
+                        else:
+                            # Show relative path from archive root for clarity
+                            relative_target = target_str.removeprefix(output_prefix)
+                            self.logger.info(f"{action_msg}: {file_path.name} -> {relative_target}")
                 else:
-                    results['errors'] += 1
-                    self.logger.error(f"ERROR: {file_path.name} - {result['reason']}")
+                    if result.reason in ['duplicate', 'already_processed']:
+                        results['duplicates'] += 1
+                        self.logger.debug(f"SKIP ({result.reason}): {file_path.name}")
+                    elif result.reason in [
+                        'unsupported_extension', 'already_in_archive', 'no_creation_date'
+                    ]:
+                        results['skipped'] += 1
+                        self.logger.debug(f"SKIP ({result.reason}): {file_path.name}")
+                    else:
+                        results['errors'] += 1
+                        self.logger.error(f"ERROR: {file_path.name} - {result.reason}")
+        finally:
+            self._dir_listings = None
+            self._placed_checksums = None
+            self._processed_index = None
+            try:
+                self._flush_marks()
+            finally:
+                self._pending_marks = None
+                self.metadata_extractor.flush_cache()
 
         return results
@@ -1,8 +1,5 @@
 """Pytest configuration and fixtures for photo organizer tests"""
 
-import tempfile
-import shutil
-from pathlib import Path
 from datetime import datetime
 import pytest
 import logging
@@ -12,11 +9,13 @@ from photo_organizer.logger import setup_logger
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests"""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
+def temp_dir(tmp_path):
+    """Create a temporary directory for tests
+
+    Backed by pytest's tmp_path, so each test (and each xdist worker) gets its
+    own directory under --basetemp, e.g. on tmpfs with `make test-tmpfs`.
+    """
+    return tmp_path
 
 
 @pytest.fixture
@@ -97,6 +97,14 @@ class TestArchiveSkipping:
         assert organizer._is_inside_archive_dir(inside_file.resolve(), archive_path) is True
         assert organizer._is_inside_archive_dir(outside_file.resolve(), archive_path) is False
 
+        # Unnormalized and relative paths are compared without resolving them
+        dotted_inside = archive_path / "subdir" / ".." / "file.jpg"
+        dotted_outside = archive_path / ".." / "outside.jpg"
+        assert organizer._is_inside_archive_dir(dotted_inside, archive_path) is True
+        assert organizer._is_inside_archive_dir(dotted_outside, archive_path) is False
+        relative_inside = Path(os.path.relpath(inside_file))
+        assert organizer._is_inside_archive_dir(relative_inside, archive_path) is True
+
     def test_skips_archive_in_subdirectory_scan(self, temp_dir, logger):
         """Test that recursive scanning properly skips archive directory"""
         # Create a complex directory structure
@@ -283,3 +291,91 @@ class TestArchiveSkipping:
         # Should process only the 4 non-archive files
         assert results['processed'] == 4, f"Should process 4 non-archive files, got {results['processed']}"
         assert results['errors'] == 0, "Should have no errors"
+
+    def test_archive_skipping_with_symlinked_input_dir(
+        self, temp_dir, logger, monkeypatch
+    ):
+        """Test archive skipping when the input directory is reached via a symlink"""
+        real_dir = temp_dir / "real_photos"
+        archive_dir = real_dir / "archive"
+        config = Config(
+            output_dir=archive_dir,
+            extensions=['jpg'],
+            dry_run=True
+        )
+
+        organizer = PhotoOrganizer(config, logger)
+
+        (real_dir / "new.jpg").write_text("new photo")
+        archived = archive_dir / "2023" / "2023_12" / "archived.jpg"
+        archived.parent.mkdir(parents=True, exist_ok=True)
+        archived.write_text("archived photo")
+
+        link_dir = temp_dir / "photos_link"
+        link_dir.symlink_to(real_dir, target_is_directory=True)
+
+        # Mock creation date
+        monkeypatch.setattr(
+            organizer.metadata_extractor,
+            "get_creation_date",
+            lambda x: datetime(2023, 12, 25, 14, 30, 45),
+        )
+
+        results = organizer.process_directory(link_dir)
+
+        assert results['processed'] == 1, (
+            f"Should process only new.jpg, got {results['processed']}"
+        )
+        assert results['errors'] == 0, "Should have no errors"
+
+    def test_skips_symlinked_file_pointing_into_archive(
+        self, temp_dir, logger, monkeypatch
+    ):
+        """Test that a symlink to an archived file is not processed again"""
+        archive_dir = temp_dir / "archive"
+        config = Config(
+            output_dir=archive_dir,
+            extensions=['jpg'],
+            dry_run=True
+        )
+
+        organizer = PhotoOrganizer(config, logger)
+
+        archived = archive_dir / "2023" / "2023_12" / "archived.jpg"
+        archived.parent.mkdir(parents=True, exist_ok=True)
+        archived.write_text("archived photo")
+        (temp_dir / "link.jpg").symlink_to(archived)
+        (temp_dir / "new.jpg").write_text("new photo")
+
+        # Mock creation date
+        monkeypatch.setattr(
+            organizer.metadata_extractor,
+            "get_creation_date",
+            lambda x: datetime(2023, 12, 25, 14, 30, 45),
+        )
+
+        results = organizer.process_directory(temp_dir)
+
+        assert results['processed'] == 1, (
+            f"Should process only new.jpg, got {results['processed']}"
+        )
+        assert results['errors'] == 0, "Should have no errors"
+
+    def test_processing_archive_directory_itself(self, temp_dir, logger):
+        """Test that pointing the organizer at its own archive processes nothing"""
+        archive_dir = temp_dir / "archive"
+        config = Config(
+            output_dir=archive_dir,
+            extensions=['jpg'],
+            dry_run=True
+        )
+
+        organizer = PhotoOrganizer(config, logger)
+
+        archived = archive_dir / "2023" / "2023_12" / "archived.jpg"
+        archived.parent.mkdir(parents=True, exist_ok=True)
+        archived.write_text("archived photo")
+
+        results = organizer.process_directory(archive_dir)
+
+        assert results == {'processed': 0, 'skipped': 0, 'duplicates': 0, 'errors': 0}
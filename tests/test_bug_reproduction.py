@@ -59,7 +59,7 @@ def test_current_implementation_deletes_files_on_error(temp_dir, logger):
         result = organizer.process_file(test_file)
 
         # The operation should have failed
-        assert not result['success'], "Operation should have failed"
+        assert not result.success, "Operation should have failed"
 
         # CRITICAL SAFETY CHECK: The original file should still exist!
         # This will FAIL with current implementation, proving the bug
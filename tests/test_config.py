@@ -15,7 +15,9 @@ def test_config_defaults():
     assert not config.dry_run
     assert not config.copy_mode
     assert config.verify_checksums
+    assert config.hash_algorithm == "blake2b"
     assert config.max_duplicate_suffix == 999
+    assert 1 <= config.max_workers <= 32
 
 
 def test_config_custom_values():
@@ -52,6 +54,20 @@ def test_is_supported_extension():
     assert not config.is_supported_extension(Path("document.txt"))
 
 
+def test_is_supported_extension_file_names():
+    """Test extension checking on plain file names"""
+    config = Config(extensions=['jpg', 'png'])
+
+    assert config.is_supported_extension("photo.jpg")
+    assert config.is_supported_extension("archive.tar.PNG")
+    assert not config.is_supported_extension("jpg")
+    assert not config.is_supported_extension(".jpg")
+    assert not config.is_supported_extension("photo.")
+    assert not config.is_supported_extension("photo.jpg.txt")
+    assert not config.is_supported_extension("photo.jpgx")
+    assert not Config(extensions=[]).is_supported_extension("photo.jpg")
+
+
 def test_config_string_path_conversion():
     """Test that string paths are converted to Path objects"""
     config = Config(output_dir="string/path")
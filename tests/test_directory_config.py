@@ -33,6 +33,13 @@ class TestBackupDriveConfig:
         assert config.enabled is True
         assert config.verify_sync is True
 
+    def test_backup_drive_config_uses_slots(self):
+        """Test that config instances carry no per-instance __dict__"""
+        config = BackupDriveConfig(label="Test Drive", mount_path="/media/drive1")
+
+        assert not hasattr(config, '__dict__')
+        assert not hasattr(DirectoryConfig(source_path="/photos"), '__dict__')
+
     def test_backup_drive_config_defaults(self):
         """Test backup drive config with default values"""
         config = BackupDriveConfig(label="Test Drive")
@@ -270,6 +277,31 @@ class TestDirectoryConfigManager:
 
             assert config is None
 
+    def test_reload_reuses_unchanged_parse_as_copies(self, config_manager):
+        """Test that reload skips parsing unchanged files and never shares objects"""
+        config_manager.set_config(DirectoryConfig(source_path="/test/path"))
+        source_path_str = str(Path("/test/path").resolve())
+        config_manager.reload()
+        loaded = config_manager.get_config("/test/path")
+        loaded.output_dir = Path("unsaved_edit")
+
+        with patch('json.load', wraps=json.load) as mock_load:
+            config_manager.reload()
+            mock_load.assert_called_once()  # Only the index is parsed again
+
+        reloaded = config_manager.get_config("/test/path")
+        assert reloaded is not loaded
+        assert reloaded.output_dir != Path("unsaved_edit")
+
+        # A changed file is parsed again
+        changed = config_manager.get_config("/test/path")
+        changed.output_dir = Path("saved_edit")
+        config_manager.set_config(changed)
+        config_manager.reload()
+        assert config_manager.get_config(source_path_str).output_dir == Path(
+            "saved_edit"
+        )
+
     def test_dict_to_config(self, config_manager):
         """Test converting dictionary to DirectoryConfig"""
         data = {
@@ -307,8 +339,8 @@ class TestDirectoryConfigManager:
 
             # Verify the file was opened for writing
             mock_file.assert_called_once()
-            # json.dump calls write multiple times, so just check that write was called
-            mock_file.return_value.__enter__.return_value.write.assert_called()
+            # The whole index is written in a single call
+            mock_file.return_value.__enter__.return_value.write.assert_called_once()
 
     def test_path_to_filename(self, config_manager):
         """Test converting paths to safe filenames"""
@@ -342,6 +374,20 @@ class TestDirectoryConfigManager:
             assert "/test/path" in config_manager._directory_configs
             assert config_manager._directory_configs["/test/path"] == test_config
 
+    def test_set_config_unchanged_index_not_rewritten(self, config_manager):
+        """Test that re-saving a known directory does not rewrite the index"""
+        test_config = DirectoryConfig(source_path="/test/path")
+        assert config_manager.set_config(test_config)
+        index_content = config_manager.index_file.read_text()
+
+        with patch('builtins.open', mock_open()) as mock_file:
+            assert config_manager.set_config(test_config)
+
+            # Only the config file itself is written
+            mock_file.assert_called_once()
+
+        assert config_manager.index_file.read_text() == index_content
+
     def test_set_config_failure(self, config_manager):
         """Test setting configuration with error"""
         test_config = DirectoryConfig(source_path="/test/path")
@@ -393,12 +439,22 @@ class TestDirectoryConfigManager:
         test_config = DirectoryConfig(source_path="/test/path")
         config_manager._directory_configs["/test/path"] = test_config
 
-        with patch('pathlib.Path.exists', return_value=True):
-            with patch('pathlib.Path.unlink'):
-                success = config_manager.remove_config("/test/path")
+        with patch('photo_organizer.directory_config.os.unlink') as mock_unlink:
+            success = config_manager.remove_config("/test/path")
 
-                assert success is True
-                assert "/test/path" not in config_manager._directory_configs
+            assert success is True
+            assert "/test/path" not in config_manager._directory_configs
+            mock_unlink.assert_called_once()
+
+    def test_remove_config_missing_file(self, config_manager):
+        """Test removing configuration whose file is already gone"""
+        test_config = DirectoryConfig(source_path="/test/path")
+        config_manager._directory_configs["/test/path"] = test_config
+
+        success = config_manager.remove_config("/test/path")
+
+        assert success is True
+        assert "/test/path" not in config_manager._directory_configs
 
     def test_remove_config_nonexistent(self, config_manager):
         """Test removing non-existent configuration"""
@@ -410,11 +466,13 @@ class TestDirectoryConfigManager:
         test_config = DirectoryConfig(source_path="/test/path")
         config_manager._directory_configs["/test/path"] = test_config
 
-        with patch('pathlib.Path.unlink', side_effect=Exception("Permission denied")):
-            with patch('pathlib.Path.exists', return_value=True):
-                success = config_manager.remove_config("/test/path")
+        with patch(
+            'photo_organizer.directory_config.os.unlink',
+            side_effect=Exception("Permission denied"),
+        ):
+            success = config_manager.remove_config("/test/path")
 
-                assert success is False
+            assert success is False
 
     def test_create_example_configs(self, config_manager):
         """Test creating example configurations"""
@@ -1,15 +1,18 @@
 """Tests for drive synchronization functionality"""
 
+import hashlib
+import os
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch
 import sqlite3
+import threading
+from typing import List, Tuple
 
 from photo_organizer.drive_comparison import (
     DriveScanner,
     DriveSynchronizer,
+    _diff_drive_files,
     sync_backup_drives,
 )
 
@@ -17,9 +20,10 @@ from photo_organizer.drive_comparison import (
 class TestDriveScanner:
     """Test DriveScanner functionality"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Set up test fixtures in pytest's per-test temporary directory"""
+        self.temp_dir = tmp_path
         self.drive_path = Path(self.temp_dir) / "test_drive"
         self.drive_path.mkdir()
         self.logger = Mock()
@@ -36,10 +40,6 @@ class TestDriveScanner:
             full_path.parent.mkdir(parents=True, exist_ok=True)
             full_path.write_bytes(content)
 
-    def teardown_method(self):
-        """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir)
-
     def test_scan_drive_to_db(self):
         """Test scanning drive and storing in database"""
         scanner = DriveScanner(self.logger)
@@ -47,6 +47,9 @@ class TestDriveScanner:
             Path(self.temp_dir) / "test_scan.sqlite"
         )  # Use temp_dir, not drive_path
 
+        # Hidden files are not scanned
+        (self.drive_path / "subfolder" / ".hidden.jpg").write_bytes(b"hidden")
+
         # Scan drive
         files_scanned = scanner.scan_drive_to_db(self.drive_path, db_path)
 
@@ -58,14 +61,126 @@ class TestDriveScanner:
         conn = sqlite3.connect(db_path)
         cursor = conn.execute("SELECT relative_path, file_size FROM drive_files")
         db_files = {row[0]: row[1] for row in cursor.fetchall()}
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
         conn.close()
 
+        assert journal_mode == "wal"
+
         # Verify all test files are in database
         for file_path in self.test_files.keys():
             assert file_path in db_files
             expected_size = len(self.test_files[file_path])
             assert db_files[file_path] == expected_size
 
+    def test_scan_drive_to_db_many_files(self):
+        """Test scanning more files than fit in a single worker batch"""
+        scanner = DriveScanner(self.logger)
+        db_path = Path(self.temp_dir) / "test_scan_many.sqlite"
+
+        for i in range(200):
+            bulk_file = self.drive_path / f"bulk_{i:03d}.jpg"
+            bulk_file.write_bytes(f"bulk data {i}".encode())
+
+        files_scanned = scanner.scan_drive_to_db(self.drive_path, db_path)
+
+        assert files_scanned == len(self.test_files) + 200
+        files = scanner.get_drive_files(db_path)
+        assert files["bulk_123.jpg"] == (
+            len(b"bulk data 123"),
+            hashlib.sha256(b"bulk data 123").hexdigest(),
+        )
+
+    def test_scan_drive_to_db_rescan_skips_unchanged_files(self):
+        """Test that a rescan only hashes new or modified files"""
+        scanner = DriveScanner(self.logger)
+        db_path = Path(self.temp_dir) / "test_rescan.sqlite"
+        scanner.scan_drive_to_db(self.drive_path, db_path)
+
+        with patch.object(
+            scanner, "_get_file_checksum_fast", wraps=scanner._get_file_checksum_fast
+        ) as mock_checksum:
+            assert scanner.scan_drive_to_db(self.drive_path, db_path) == 0
+            assert mock_checksum.call_count == 0
+
+            # Same size, different content and modification time
+            changed = self.drive_path / "photo1.jpg"
+            changed.write_bytes(b"fake photo DATA 1")
+            stat = changed.stat()
+            os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            assert scanner.scan_drive_to_db(self.drive_path, db_path) == 1
+            assert mock_checksum.call_count == 1
+            assert scanner.get_drive_files(db_path)["photo1.jpg"][1] == (
+                hashlib.sha256(b"fake photo DATA 1").hexdigest()
+            )
+
+            # Forcing a rescan hashes everything again
+            assert scanner.scan_drive_to_db(
+                self.drive_path, db_path, force_rescan=True
+            ) == 3
+            assert mock_checksum.call_count == 4
+
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available"
+    )
+    def test_process_file_batch_uses_walk_stat(self):
+        """Test that batch workers reuse the stat taken while walking the drive"""
+        scanner = DriveScanner(self.logger)
+        file_path = self.drive_path / "photo1.jpg"
+        walk_stat = file_path.stat()
+
+        with patch.object(Path, "stat", side_effect=AssertionError("stat again")):
+            (row,) = scanner._process_file_batch(
+                [(file_path, walk_stat)], self.drive_path
+            )
+
+        assert row[:4] == (
+            "photo1.jpg", str(file_path), walk_stat.st_size, walk_stat.st_mtime_ns
+        )
+
+    def test_get_file_checksum_drops_large_files_from_cache(self):
+        """Test that files above the threshold are advised out of the page cache"""
+        scanner = DriveScanner(self.logger)
+        scanner.UNCACHED_READ_THRESHOLD = 50
+        small = self.drive_path / "photo1.jpg"
+        large = self.drive_path / "large.jpg"
+        large.write_bytes(b"x" * 100)
+
+        with patch("photo_organizer.drive_comparison.os.posix_fadvise") as mock_fadvise:
+            small_checksum = hashlib.sha256(self.test_files["photo1.jpg"]).hexdigest()
+            assert scanner._get_file_checksum(small) == small_checksum
+            mock_fadvise.assert_not_called()
+
+            large_checksum = hashlib.sha256(b"x" * 100).hexdigest()
+            assert scanner._get_file_checksum(large) == large_checksum
+            mock_fadvise.assert_called_once()
+
+    def test_checksums_stored_as_raw_digests(self):
+        """Test that checksums are stored as 32-byte digests and read back as hex"""
+        scanner = DriveScanner(self.logger)
+        db_path = Path(self.temp_dir) / "test_blob.sqlite"
+        scanner.scan_drive_to_db(self.drive_path, db_path)
+
+        conn = sqlite3.connect(db_path)
+        stored = conn.execute(
+            "SELECT checksum FROM drive_files WHERE relative_path = 'photo1.jpg'"
+        ).fetchone()[0]
+        # Rows written by older versions hold hex text
+        legacy_checksum = hashlib.sha256(b"legacy").hexdigest()
+        conn.execute(
+            "INSERT INTO drive_files (relative_path, file_size, checksum) "
+            "VALUES (?, ?, ?)",
+            ("legacy.jpg", 6, legacy_checksum),
+        )
+        conn.commit()
+        conn.close()
+
+        photo1_hash = hashlib.sha256(self.test_files["photo1.jpg"])
+        assert stored == photo1_hash.digest()
+        files = scanner.get_drive_files(db_path)
+        assert files["photo1.jpg"][1] == photo1_hash.hexdigest()
+        assert files["legacy.jpg"] == (6, legacy_checksum)
+
     def test_get_drive_files(self):
         """Test retrieving files from drive database"""
         scanner = DriveScanner(self.logger)
@@ -86,14 +201,16 @@ class TestDriveScanner:
             assert size == len(self.test_files[file_path])
             assert len(checksum) == 64  # SHA-256 hex length
             assert checksum.isalnum()  # Should be alphanumeric
+            assert checksum == hashlib.sha256(self.test_files[file_path]).hexdigest()
 
 
 class TestDriveSynchronizer:
     """Test DriveSynchronizer functionality"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Set up test fixtures in pytest's per-test temporary directory"""
+        self.temp_dir = tmp_path
         self.drive1_path = Path(self.temp_dir) / "drive1"
         self.drive2_path = Path(self.temp_dir) / "drive2"
         self.drive1_path.mkdir()
@@ -124,10 +241,6 @@ class TestDriveSynchronizer:
             full_path.parent.mkdir(parents=True, exist_ok=True)
             full_path.write_bytes(content)
 
-    def teardown_method(self):
-        """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir)
-
     def test_safe_copy_file(self):
         """Test safe file copying with verification"""
         synchronizer = DriveSynchronizer(self.logger)
@@ -142,6 +255,20 @@ class TestDriveSynchronizer:
         assert result is True
         assert target_file.exists()
         assert target_file.read_bytes() == source_file.read_bytes()
+        assert target_file.stat().st_mtime == source_file.stat().st_mtime
+
+    def test_calculate_checksum_small_and_large_files(self):
+        """Test checksums of files read directly and through a memory map"""
+        synchronizer = DriveSynchronizer(self.logger)
+
+        for name, content in [
+            ("small.jpg", b"small"),
+            ("large.jpg", b"x" * (2 * 1024 * 1024)),
+        ]:
+            file_path = self.drive1_path / name
+            file_path.write_bytes(content)
+            expected = hashlib.sha256(content).hexdigest()
+            assert synchronizer._calculate_checksum(file_path) == expected
 
     def test_safe_copy_file_verification_failure(self):
         """Test copy verification failure handling"""
@@ -161,6 +288,21 @@ class TestDriveSynchronizer:
             # Target file should be removed
             assert not target_file.exists()
 
+    def test_diff_drive_files(self):
+        """Test splitting two listings into missing, different and identical files"""
+        drive1_files = {"b.jpg": (1, "aa"), "a.jpg": (1, "bb"), "same.jpg": (2, "cc")}
+        drive2_files = {"d.jpg": (1, "dd"), "same.jpg": (2, "cc"), "a.jpg": (1, "ee")}
+
+        only1, only2, different, identical = _diff_drive_files(
+            drive1_files, drive2_files
+        )
+
+        assert only1 == ["b.jpg"]
+        assert only2 == ["d.jpg"]
+        assert [diff["path"] for diff in different] == ["a.jpg"]
+        assert different[0]["drive2"] == {"size": 1, "checksum": "ee"}
+        assert identical == ["same.jpg"]
+
     def test_sync_drives_dry_run(self):
         """Test drive synchronization in dry-run mode"""
         synchronizer = DriveSynchronizer(self.logger)
@@ -228,13 +370,45 @@ class TestDriveSynchronizer:
         assert (self.drive2_path / "photo1.jpg").exists()
         assert (self.drive2_path / "photo2.jpg").exists()
 
+    def test_sync_drives_counts_failed_and_cancelled_copies(self):
+        """Test that failed copies are counted and cancelled copies are skipped"""
+        synchronizer = DriveSynchronizer(self.logger)
+
+        drive1_files = {
+            "photo1.jpg": (len(self.drive1_files["photo1.jpg"]), "checksum1"),
+            "missing.jpg": (10, "checksum_missing"),
+        }
+
+        stats = synchronizer.sync_drives(
+            self.drive1_path, self.drive2_path, drive1_files, {}, dry_run=False
+        )
+
+        assert stats["files_copied_to_drive2"] == 1
+        assert stats["errors"] == 1
+        assert stats["bytes_copied"] == len(self.drive1_files["photo1.jpg"])
+
+        # Progress is logged as each copy finishes, failures with their path
+        info_messages = [call.args[0] for call in self.logger.info.call_args_list]
+        assert any(m.endswith("Copied to Drive 2: photo1.jpg") for m in info_messages)
+        error_messages = [call.args[0] for call in self.logger.error.call_args_list]
+        assert any(
+            m.endswith("Failed to copy to Drive 2: missing.jpg") for m in error_messages
+        )
+
+        synchronizer.cancel()
+        assert synchronizer._copy_unless_cancelled(
+            self.drive1_path / "photo2.jpg", self.drive2_path / "photo2.jpg"
+        ) is None
+        assert not (self.drive2_path / "photo2.jpg").exists()
+
 
 class TestDriveSyncIntegration:
     """Integration tests for drive synchronization"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Set up test fixtures in pytest's per-test temporary directory"""
+        self.temp_dir = tmp_path
         self.drive1_path = Path(self.temp_dir) / "drive1"
         self.drive2_path = Path(self.temp_dir) / "drive2"
         self.drive1_path.mkdir()
@@ -244,10 +418,6 @@ class TestDriveSyncIntegration:
         # Create test files
         self.create_test_files()
 
-    def teardown_method(self):
-        """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir)
-
     def create_test_files(self):
         """Create test files on both drives"""
         # Drive 1 files
@@ -274,45 +444,74 @@ class TestDriveSyncIntegration:
             full_path.parent.mkdir(parents=True, exist_ok=True)
             full_path.write_bytes(content)
 
-    @patch("photo_organizer.drive_comparison.DriveScanner")
-    @patch("photo_organizer.drive_comparison.DriveSynchronizer")
-    def test_sync_backup_drives_integration(self, mock_sync_class, mock_scanner_class):
+    def test_sync_backup_drives_integration(self, monkeypatch):
         """Test full drive synchronization integration"""
-        # Mock scanner behavior
-        mock_scanner = Mock()
-        mock_scanner_class.return_value = mock_scanner
-        mock_scanner.scan_drive_to_db.return_value = 3
-        mock_scanner._cancelled.is_set.return_value = False
-
         # Return different files on each drive to trigger sync
-        drive1_files = {
-            "photos/2024/photo1.jpg": (len(b"drive1 photo 1 content"), "checksum1"),
-            "photos/2024/photo2.jpg": (len(b"drive1 photo 2 content"), "checksum2"),
-            "photos/2024/common.jpg": (len(b"drive1 common content"), "checksum3"),
-        }
-
-        drive2_files = {
-            "photos/2024/photo3.jpg": (len(b"drive2 photo 3 content"), "checksum4"),
-            "photos/2024/photo4.jpg": (len(b"drive2 photo 4 content"), "checksum5"),
-            "photos/2024/common.jpg": (
-                len(b"drive2 common content different"),
-                "checksum6",
-            ),
-        }
-
-        mock_scanner.get_drive_files.side_effect = [drive1_files, drive2_files]
-
-        # Mock synchronizer behavior
-        mock_synchronizer = Mock()
-        mock_sync_class.return_value = mock_synchronizer
-        mock_synchronizer._cancelled.is_set.return_value = False
-        mock_synchronizer.sync_drives.return_value = {
-            "files_copied_to_drive1": 2,
-            "files_copied_to_drive2": 2,
-            "files_skipped": 1,
-            "errors": 0,
-            "bytes_copied": 400,
-        }
+        drive_files = [
+            {
+                "photos/2024/photo1.jpg": (len(b"drive1 photo 1 content"), "checksum1"),
+                "photos/2024/photo2.jpg": (len(b"drive1 photo 2 content"), "checksum2"),
+                "photos/2024/common.jpg": (len(b"drive1 common content"), "checksum3"),
+            },
+            {
+                "photos/2024/photo3.jpg": (len(b"drive2 photo 3 content"), "checksum4"),
+                "photos/2024/photo4.jpg": (len(b"drive2 photo 4 content"), "checksum5"),
+                "photos/2024/common.jpg": (
+                    len(b"drive2 common content different"),
+                    "checksum6",
+                ),
+            },
+        ]
+        listings = iter(drive_files)
+        sync_calls: List[Tuple[dict, dict]] = []
+
+        class FakeScanner:
+            """In-process stand-in for DriveScanner serving the listings above"""
+
+            def __init__(self, logger):
+                self._cancelled = threading.Event()
+
+            def scan_drive_to_db(self, drive_path, db_path=None, force_rescan=False):
+                return 3
+
+            def get_drive_files(self, db_path):
+                return next(listings)
+
+            def cancel(self):
+                self._cancelled.set()
+
+        class FakeSynchronizer:
+            """In-process stand-in for DriveSynchronizer recording sync requests"""
+
+            def __init__(self, logger):
+                self._cancelled = threading.Event()
+
+            def sync_drives(
+                self,
+                drive1_path,
+                drive2_path,
+                drive1_files,
+                drive2_files,
+                dry_run=False,
+            ):
+                sync_calls.append((drive1_files, drive2_files))
+                return {
+                    "files_copied_to_drive1": 2,
+                    "files_copied_to_drive2": 2,
+                    "files_skipped": 1,
+                    "errors": 0,
+                    "bytes_copied": 400,
+                }
+
+            def cancel(self):
+                self._cancelled.set()
+
+        monkeypatch.setattr(
+            "photo_organizer.drive_comparison.DriveScanner", FakeScanner
+        )
+        monkeypatch.setattr(
+            "photo_organizer.drive_comparison.DriveSynchronizer", FakeSynchronizer
+        )
 
         # Run synchronization
         result = sync_backup_drives(
@@ -328,8 +527,54 @@ class TestDriveSyncIntegration:
 
         # Verify logging calls were made
         assert self.logger.info.called
-        # Verify synchronizer was called
-        mock_synchronizer.sync_drives.assert_called_once()
+        # Verify synchronizer was called once with both file listings
+        assert len(sync_calls) == 1
+        drive1_files, drive2_files = sync_calls[0]
+        assert drive1_files.keys() == {
+            "photos/2024/photo1.jpg", "photos/2024/photo2.jpg", "photos/2024/common.jpg"
+        }
+        assert drive2_files.keys() == {
+            "photos/2024/photo3.jpg", "photos/2024/photo4.jpg", "photos/2024/common.jpg"
+        }
+
+    def test_sync_backup_drives_rescan_hashes_only_changed_files(self):
+        """Test that --rescan updates scans without rehashing unchanged files"""
+        assert sync_backup_drives(
+            self.drive1_path, self.drive2_path, self.logger, dry_run=True
+        )
+        new_file = self.drive1_path / "photos/2024/photo5.jpg"
+        new_file.write_bytes(b"drive1 photo 5 content")
+
+        with patch.object(
+            DriveScanner,
+            "_get_file_checksum_fast",
+            autospec=True,
+            side_effect=DriveScanner._get_file_checksum_fast,
+        ) as mock_checksum:
+            # Without a rescan the existing scans are used as they are
+            assert sync_backup_drives(
+                self.drive1_path, self.drive2_path, self.logger, dry_run=True
+            )
+            assert mock_checksum.call_count == 0
+
+            assert sync_backup_drives(
+                self.drive1_path,
+                self.drive2_path,
+                self.logger,
+                dry_run=True,
+                rescan=True,
+            )
+            assert mock_checksum.call_count == 1
+
+            # A full rescan hashes every file on both drives again
+            assert sync_backup_drives(
+                self.drive1_path,
+                self.drive2_path,
+                self.logger,
+                force_rescan=True,
+                dry_run=True,
+            )
+            assert mock_checksum.call_count == 1 + 7
 
 
 if __name__ == "__main__":
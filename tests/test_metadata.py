@@ -1,7 +1,10 @@
 """Tests for metadata extraction"""
 
 from datetime import datetime
+import os
 from pathlib import Path
+import sqlite3
+from unittest.mock import Mock
 import pytest
 
 from photo_organizer.metadata import MetadataExtractor
@@ -57,8 +60,115 @@ def test_parse_exif_date_invalid_format(metadata_extractor):
         assert result is None
 
 
+def test_parse_exif_date_out_of_range_and_short_fields(metadata_extractor):
+    """Test zeroed EXIF dates and single-digit fields"""
+    assert metadata_extractor._parse_exif_date("0000:00:00 00:00:00") is None
+    assert metadata_extractor._parse_exif_date("2023:13:01 10:00:00") is None
+    assert metadata_extractor._parse_exif_date("2023:1:5 9:05:07") == datetime(
+        2023, 1, 5, 9, 5, 7
+    )
+
+
 def test_get_creation_date_nonexistent_file(metadata_extractor):
     """Test handling of nonexistent files"""
     nonexistent = Path("does_not_exist.jpg")
     result = metadata_extractor.get_creation_date(nonexistent)
     assert result is None
+
+
+def test_creation_date_cache_persists_between_instances(temp_dir, sample_jpg):
+    """Test that cached dates are reused without reading the file again"""
+    cache_path = temp_dir / "cache.sqlite"
+
+    first = MetadataExtractor(cache_path=cache_path)
+    date = first.get_creation_date(sample_jpg)
+    assert date is not None
+    first.flush_cache()
+
+    second = MetadataExtractor(cache_path=cache_path)
+    assert not second._cache  # Stored dates are read on demand, not at startup
+    second._methods = ()  # Any lookup that misses the cache now fails
+    assert second.get_creation_date(sample_jpg) == date
+
+
+def test_creation_date_cache_written_on_flush_and_pruned(temp_dir, sample_jpg):
+    """Test that cached dates are written in one batch and forgotten files are pruned"""
+    cache_path = temp_dir / "cache.sqlite"
+
+    def cached_rows():
+        with sqlite3.connect(cache_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM creation_dates").fetchone()[0]
+
+    extractor = MetadataExtractor(cache_path=cache_path)
+    assert extractor.get_creation_date(sample_jpg) is not None
+    assert cached_rows() == 0  # Nothing written before the flush
+
+    extractor.flush_cache()
+    assert cached_rows() == 1
+
+    # A later run reads the stored date, then the file is moved away
+    later = MetadataExtractor(cache_path=cache_path)
+    later._methods = ()  # Any lookup that misses the cache now fails
+    assert later.get_creation_date(sample_jpg) is not None
+    later.forget(sample_jpg)
+    later.flush_cache()
+    assert cached_rows() == 0
+
+
+def test_creation_date_cache_invalidated_on_change(temp_dir, sample_jpg):
+    """Test that modifying a file invalidates its cached date"""
+    extractor = MetadataExtractor(cache_path=temp_dir / "cache.sqlite")
+    assert extractor.get_creation_date(sample_jpg) == datetime(2023, 12, 25, 14, 30, 45)
+
+    new_time = datetime(2024, 2, 1, 8, 0, 0).timestamp()
+    os.utime(sample_jpg, (new_time, new_time))
+
+    assert extractor.get_creation_date(sample_jpg) == datetime(2024, 2, 1, 8, 0, 0)
+
+
+def test_creation_date_memoized_without_cache_file(metadata_extractor, sample_jpg):
+    """Test that repeated lookups of an unchanged file reuse the extracted date"""
+    date = metadata_extractor.get_creation_date(sample_jpg)
+    assert date is not None
+
+    metadata_extractor._methods = ()  # Any lookup that misses the cache now fails
+    assert metadata_extractor.get_creation_date(sample_jpg) == date
+
+
+def test_creation_date_memo_is_bounded(metadata_extractor, temp_dir, monkeypatch):
+    """Test that the in-memory cache evicts the least recently used dates"""
+    monkeypatch.setattr(metadata_extractor, "CACHE_MAXSIZE", 2)
+    photos = []
+    for name in ("a.jpg", "b.jpg", "c.jpg"):
+        photo = temp_dir / name
+        photo.write_bytes(b"not an image")
+        photos.append(photo)
+
+    first, second, third = photos
+    metadata_extractor.get_creation_date(first)
+    metadata_extractor.get_creation_date(second)
+    metadata_extractor.get_creation_date(first)  # Now the most recently used
+    metadata_extractor.get_creation_date(third)
+
+    cached_keys = set(metadata_extractor._cache)
+    assert len(cached_keys) == 2
+    assert metadata_extractor._cache_key(first) in cached_keys
+    assert metadata_extractor._cache_key(second) not in cached_keys
+
+
+def test_get_creation_date_skips_exif_parsing_for_non_images(
+    metadata_extractor, temp_dir, sample_jpg
+):
+    """Test that files without an image signature go straight to the filesystem date"""
+    exif_method = Mock(return_value=datetime(2000, 1, 1), __name__="exif_method")
+    metadata_extractor._methods = (
+        exif_method, metadata_extractor._get_date_from_filesystem
+    )
+
+    fake_jpg = temp_dir / "not_an_image.jpg"
+    fake_jpg.write_text("fake image content")
+
+    assert metadata_extractor.get_creation_date(fake_jpg) != datetime(2000, 1, 1)
+    exif_method.assert_not_called()
+
+    assert metadata_extractor.get_creation_date(sample_jpg) == datetime(2000, 1, 1)
@@ -1,10 +1,16 @@
 """Tests for the main organizer functionality - safety first!"""
 
 from datetime import datetime
+import hashlib
+import os
 from pathlib import Path
 import pytest
 import sqlite3
+from unittest.mock import Mock, patch
 
+from photo_organizer import organizer as organizer_module
+from photo_organizer.config import Config
+from photo_organizer.file_utils import FileOperations
 from photo_organizer.organizer import PhotoOrganizer
 
 
@@ -39,6 +45,41 @@ def test_get_file_checksum(organizer, sample_jpg):
     checksum2 = organizer._get_file_checksum(sample_jpg)
     assert checksum == checksum2
 
+    # The size is read from the same open file that was hashed
+    assert organizer._get_file_checksum_and_size(sample_jpg) == (
+        checksum, sample_jpg.stat().st_size
+    )
+
+
+def test_get_file_checksum_empty_file(organizer, temp_dir):
+    """Test checksum of an empty file, which cannot be memory-mapped"""
+    empty_file = temp_dir / "empty.jpg"
+    empty_file.write_bytes(b"")
+
+    checksum = organizer._get_file_checksum(empty_file)
+
+    assert checksum == (
+        "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+    )
+
+
+def test_get_file_checksum_maps_only_large_files(organizer, temp_dir, monkeypatch):
+    """Test that only files above the threshold are hashed from a memory map"""
+    data = b"x" * 4096
+    photo = temp_dir / "photo.jpg"
+    photo.write_bytes(data)
+    expected = hashlib.sha256(data).hexdigest()
+
+    mock_mmap = Mock(side_effect=organizer_module.mmap.mmap)
+    monkeypatch.setattr(organizer_module.mmap, "mmap", mock_mmap)
+
+    assert organizer._get_file_checksum(photo) == expected
+    mock_mmap.assert_not_called()
+
+    monkeypatch.setattr(organizer, "MMAP_HASH_THRESHOLD", len(data) - 1)
+    assert organizer._get_file_checksum(photo) == expected
+    mock_mmap.assert_called_once()
+
 
 def test_is_already_processed_new_file(organizer, sample_jpg):
     """Test detection of new (unprocessed) file"""
@@ -63,6 +104,20 @@ def test_mark_and_check_processed_file(organizer, sample_jpg, temp_dir):
     assert stored_target == str(target_path)
 
 
+def test_mark_as_processed_updates_existing_record(organizer, sample_jpg, temp_dir):
+    """Test that re-marking a file updates its record in place"""
+    file_size = sample_jpg.stat().st_size
+    organizer._mark_as_processed(sample_jpg, "old", temp_dir / "old.jpg", file_size)
+    organizer._mark_as_processed(sample_jpg, "new", temp_dir / "new.jpg", file_size)
+
+    conn = sqlite3.connect(organizer.processed_files_db)
+    rows = conn.execute(
+        "SELECT rowid, original_checksum, new_path FROM processed_files"
+    ).fetchall()
+    conn.close()
+    assert rows == [(1, "new", str(temp_dir / "new.jpg"))]
+
+
 def test_generate_target_path(organizer):
     """Test target path generation"""
     original_path = Path("test_photo.jpg")
@@ -96,6 +151,25 @@ def test_find_safe_target_path_with_conflict(organizer, temp_dir):
     assert not safe_path.exists()  # Should be available
 
 
+def test_find_safe_target_path_skips_taken_suffixes(organizer, temp_dir):
+    """Test that the first free numbered suffix is chosen"""
+    target_path = temp_dir / "existing_file.jpg"
+    target_path.write_text("existing content")
+    (temp_dir / "existing_file_001.jpg").write_text("first duplicate")
+    (temp_dir / "existing_file_002.jpg").write_text("second duplicate")
+
+    safe_path = organizer._find_safe_target_path(target_path)
+
+    assert safe_path == temp_dir / "existing_file_003.jpg"
+
+
+def test_find_safe_target_path_missing_directory(organizer, temp_dir):
+    """Test safe target path when the target directory does not exist yet"""
+    target_path = temp_dir / "not_created" / "new_file.jpg"
+
+    assert organizer._find_safe_target_path(target_path) == target_path
+
+
 def test_handle_existing_file_no_conflict(organizer, sample_jpg, temp_dir):
     """Test handling when no existing file conflict"""
     target_path = temp_dir / "no_conflict.jpg"
@@ -106,6 +180,21 @@ def test_handle_existing_file_no_conflict(organizer, sample_jpg, temp_dir):
     assert conflict_type == "no_conflict"
 
 
+def test_handle_existing_file_without_run_skips_listing(
+    organizer, sample_jpg, temp_dir
+):
+    """Test that a lookup outside process_directory does not list the directory"""
+    target_path = temp_dir / "no_conflict.jpg"
+
+    with patch("photo_organizer.organizer.os.scandir") as mock_scandir:
+        assert organizer._handle_existing_file(sample_jpg, target_path) == (
+            True, "no_conflict"
+        )
+        assert organizer._find_safe_target_path(target_path) == target_path
+
+    mock_scandir.assert_not_called()
+
+
 def test_handle_existing_file_duplicate_content(organizer, temp_dir):
     """Test detection of true duplicates (same content)"""
     # Create two files with identical content
@@ -136,13 +225,51 @@ def test_handle_existing_file_name_conflict(organizer, temp_dir):
     assert conflict_type == "name_conflict"
 
 
+def test_handle_existing_file_same_size_different_content(organizer, temp_dir):
+    """Test that equal-sized files with different content are not duplicates"""
+    source_path = temp_dir / "source.jpg"
+    target_path = temp_dir / "target.jpg"
+
+    source_path.write_text("content A")
+    target_path.write_text("content B")
+
+    can_proceed, conflict_type = organizer._handle_existing_file(
+        source_path, target_path
+    )
+
+    assert can_proceed
+    assert conflict_type == "name_conflict"
+
+
+def test_handle_existing_file_compares_first_block_before_hashing(organizer, temp_dir):
+    """Test that a differing first block settles a same-size conflict without hashing"""
+    source_path = temp_dir / "source.jpg"
+    target_path = temp_dir / "target.jpg"
+    source_path.write_bytes(b"A" + b"x" * 5000)
+    target_path.write_bytes(b"B" + b"x" * 5000)
+
+    with patch.object(organizer, "_get_file_checksum") as mock_checksum:
+        assert organizer._handle_existing_file(source_path, target_path) == (
+            True, "name_conflict"
+        )
+    mock_checksum.assert_not_called()
+
+    # Matching first blocks still need the full comparison
+    target_path.write_bytes(b"A" + b"x" * 4999 + b"y")
+    assert organizer._handle_existing_file(source_path, target_path) == (
+        True, "name_conflict"
+    )
+
+
 def test_is_in_archive_structure(organizer):
     """Test detection of files already in archive structure"""
     # Files in archive structure
     archive_files = [
         Path("archive/2023/2023-12/photo.jpg"),
         Path("some/path/2023/2023-12/another.jpg"),
-        Path("2024/2024-01/test.jpg")
+        Path("2024/2024-01/test.jpg"),
+        Path("archive/2023/2023_12/photo.jpg"),
+        Path("archive/2023/2023-12/nested/photo.jpg")
     ]
 
     for file_path in archive_files:
@@ -152,7 +279,9 @@ def test_is_in_archive_structure(organizer):
     non_archive_files = [
         Path("random/photo.jpg"),
         Path("2023-photos/image.jpg"),
-        Path("photo.jpg")
+        Path("photo.jpg"),
+        Path("2023/2024-12/photo.jpg"),
+        Path("2023/2023-12.jpg")
     ]
 
     for file_path in non_archive_files:
@@ -166,9 +295,9 @@ def test_process_file_unsupported_extension(organizer, temp_dir):
 
     result = organizer.process_file(txt_file)
 
-    assert not result['success']
-    assert result['action'] == 'skipped'
-    assert result['reason'] == 'unsupported_extension'
+    assert not result.success
+    assert result.action == 'skipped'
+    assert result.reason == 'unsupported_extension'
 
 
 def test_process_file_already_in_archive(organizer, temp_dir):
@@ -179,10 +308,36 @@ def test_process_file_already_in_archive(organizer, temp_dir):
     archive_file = archive_dir / "photo.jpg"
     archive_file.write_text("photo content")
 
-    result = organizer.process_file(archive_file)
+    with patch.object(organizer, "_get_file_checksum_and_size") as mock_checksum:
+        result = organizer.process_file(archive_file)
+
+    assert not result.success
+    assert result.reason == 'already_in_archive'
+    # The path alone decides this, so the file is never read
+    mock_checksum.assert_not_called()
+
+
+def test_process_directory_counts_processed_archive_files_as_duplicates(
+    organizer, temp_dir
+):
+    """Test that a processed file inside an archive structure stays a duplicate"""
+    archive_dir = temp_dir / "input" / "2023" / "2023-12"
+    archive_dir.mkdir(parents=True)
+    processed_file = archive_dir / "processed.jpg"
+    processed_file.write_text("processed content")
+    unrecorded_file = archive_dir / "unrecorded.jpg"
+    unrecorded_file.write_text("unrecorded content")
+
+    checksum, file_size = organizer._get_file_checksum_and_size(processed_file)
+    organizer._mark_as_processed(
+        processed_file, checksum, temp_dir / "archive" / "processed.jpg", file_size
+    )
 
-    assert not result['success']
-    assert result['reason'] == 'already_in_archive'
+    results = organizer.process_directory(temp_dir / "input")
+
+    assert results['duplicates'] == 1  # already_processed, as before the reorder
+    assert results['skipped'] == 1  # already_in_archive
+    assert results['processed'] == 0
 
 
 def test_process_file_dry_run_mode(organizer, sample_files, sample_config):
@@ -192,8 +347,8 @@ def test_process_file_dry_run_mode(organizer, sample_files, sample_config):
 
     result = organizer.process_file(sample_files[0])
 
-    if result['success']:
-        assert result['action'] == 'dry_run'
+    if result.success:
+        assert result.action == 'dry_run'
         # File should not have been moved
         assert sample_files[0].exists()
 
@@ -213,6 +368,25 @@ def test_process_directory_statistics(organizer, sample_files):
         assert count >= 0
 
 
+def test_process_directory_many_files(organizer, temp_dir):
+    """Test that every file is processed when there are more than the prefetch window"""
+    input_dir = temp_dir / "input"
+    input_dir.mkdir()
+
+    for i in range(50):
+        file_path = input_dir / f"IMG_{i:04d}.jpg"
+        file_path.write_text(f"photo content {i}")
+        test_time = datetime(2023, 1, 1, 0, 0, i % 60).timestamp() + i * 3600
+        os.utime(file_path, (test_time, test_time))
+
+    results = organizer.process_directory(input_dir)
+
+    assert results['processed'] == 50
+    assert results['errors'] == 0
+    assert len(list(organizer.config.output_dir.rglob("*.jpg"))) == 50
+    assert not list(input_dir.glob("*.jpg"))
+
+
 def test_safety_no_data_loss(organizer, sample_files, logger):
     """Critical test: ensure no data loss occurs during processing"""
     input_dir = sample_files[0].parent
@@ -256,6 +430,27 @@ def test_safety_no_data_loss(organizer, sample_files, logger):
         assert found, f"File lost during processing: {original_name}"
 
 
+def test_iter_recently_processed(organizer, sample_files, monkeypatch):
+    """Test listing the targets of files processed since a given time"""
+    organizer.process_directory(sample_files[0].parent)
+    before_run = datetime.now()
+
+    monkeypatch.setattr(
+        organizer.metadata_extractor,
+        "get_creation_date",
+        lambda x: datetime(2024, 5, 1, 12, 0, 0),
+    )
+    new_file = sample_files[0].parent / "photo_new.jpg"
+    new_file.write_text("new content")
+    organizer.process_directory(new_file.parent)
+
+    recent = list(organizer.iter_recently_processed(before_run))
+    target_dir = organizer.config.output_dir / "2024" / "2024_05"
+    assert recent == [target_dir / "2024-05-01_12-00-00.jpg"]
+    all_processed = list(organizer.iter_recently_processed(datetime(2000, 1, 1)))
+    assert len(all_processed) == len(sample_files) + 1
+
+
 def test_generate_target_path_rename_only(organizer, sample_config):
     """Test target path generation in rename-only mode"""
     sample_config.rename_only = True
@@ -279,14 +474,13 @@ def test_process_file_rename_only_mode(organizer, sample_config, temp_dir):
     original_file.write_text("test image content")
 
     # Set file timestamp for predictable naming
-    import os
     test_time = datetime(2023, 12, 25, 14, 30, 45).timestamp()
     os.utime(original_file, (test_time, test_time))
 
     result = organizer.process_file(original_file)
 
-    if result['success']:
-        assert result['action'] == 'renamed'
+    if result.success:
+        assert result.action == 'renamed'
 
         # Original file should not exist
         assert not original_file.exists()
@@ -297,6 +491,17 @@ def test_process_file_rename_only_mode(organizer, sample_config, temp_dir):
         assert renamed_file.read_text() == "test image content"
 
 
+def test_dry_run_writes_no_date_cache(sample_config, logger, sample_jpg):
+    """Test that a dry run does not create the creation-date cache database"""
+    sample_config.dry_run = True
+    dry_organizer = PhotoOrganizer(sample_config, logger)
+
+    dry_organizer.process_file(sample_jpg)
+
+    assert dry_organizer.metadata_extractor.cache_path is None
+    assert not (sample_config.output_dir / ".photo_organizer_cache.sqlite").exists()
+
+
 def test_process_file_rename_only_dry_run(organizer, sample_config, temp_dir):
     """Test processing file in rename-only dry run mode"""
     sample_config.rename_only = True
@@ -307,14 +512,13 @@ def test_process_file_rename_only_dry_run(organizer, sample_config, temp_dir):
     original_file.write_text("test image content")
 
     # Set file timestamp for predictable naming
-    import os
     test_time = datetime(2023, 12, 25, 14, 30, 45).timestamp()
     os.utime(original_file, (test_time, test_time))
 
     result = organizer.process_file(original_file)
 
-    if result['success']:
-        assert result['action'] == 'dry_run'
+    if result.success:
+        assert result.action == 'dry_run'
 
         # Original file should still exist in dry run
         assert original_file.exists()
@@ -322,7 +526,7 @@ def test_process_file_rename_only_dry_run(organizer, sample_config, temp_dir):
 
         # Target path should be in same directory
         expected_target = temp_dir / "2023-12-25_14-30-45.jpg"
-        assert result['target_path'] == str(expected_target)
+        assert result.target_path == str(expected_target)
 
 
 def test_rename_only_conflict_handling(organizer, sample_config, temp_dir):
@@ -338,14 +542,13 @@ def test_rename_only_conflict_handling(organizer, sample_config, temp_dir):
     target_file.write_text("existing content")
 
     # Set file timestamp for predictable naming
-    import os
     test_time = datetime(2023, 12, 25, 14, 30, 45).timestamp()
     os.utime(original_file, (test_time, test_time))
 
     result = organizer.process_file(original_file)
 
-    if result['success']:
-        assert result['action'] == 'renamed'
+    if result.success:
+        assert result.action == 'renamed'
 
         # Original file should not exist
         assert not original_file.exists()
@@ -373,14 +576,13 @@ def test_rename_only_duplicate_detection(organizer, sample_config, temp_dir):
     target_file.write_text("identical content")
 
     # Set file timestamp for predictable naming
-    import os
     test_time = datetime(2023, 12, 25, 14, 30, 45).timestamp()
     os.utime(original_file, (test_time, test_time))
 
     result = organizer.process_file(original_file)
 
-    assert not result['success']
-    assert result['reason'] == 'duplicate'
+    assert not result.success
+    assert result.reason == 'duplicate'
 
     # Both files should still exist
     assert original_file.exists()
@@ -394,7 +596,6 @@ def test_rename_only_vs_normal_mode_behavior(organizer, sample_config, temp_dir)
     original_file.write_text("test content")
 
     # Set file timestamp
-    import os
     test_time = datetime(2023, 12, 25, 14, 30, 45).timestamp()
     os.utime(original_file, (test_time, test_time))
 
@@ -420,8 +621,6 @@ def test_rename_only_vs_normal_mode_behavior(organizer, sample_config, temp_dir)
 
 def test_file_operations_safe_rename(sample_config, logger, temp_dir):
     """Test the safe_rename method in FileOperations"""
-    from photo_organizer.file_utils import FileOperations
-
     file_ops = FileOperations(sample_config, logger)
 
     # Create test file
@@ -438,10 +637,38 @@ def test_file_operations_safe_rename(sample_config, logger, temp_dir):
     assert target_file.read_text() == "test content"
 
 
+def test_file_operations_safe_rename_verifies_without_hashing(
+    sample_config, logger, temp_dir
+):
+    """Test that a verified rename checks file identity instead of reading the data"""
+    file_ops = FileOperations(sample_config, logger)
+    source_file = temp_dir / "source.jpg"
+    target_file = temp_dir / "target.jpg"
+    source_file.write_text("test content")
+    inode = source_file.stat().st_ino
+
+    with patch.object(file_ops, "_calculate_checksum") as mock_checksum:
+        assert file_ops.safe_rename(source_file, target_file, verify=True)
+
+    mock_checksum.assert_not_called()
+    assert target_file.stat().st_ino == inode
+
+
+def test_file_operations_safe_rename_never_overwrites(sample_config, logger, temp_dir):
+    """Test that safe_rename fails instead of replacing an existing target"""
+    file_ops = FileOperations(sample_config, logger)
+    source_file = temp_dir / "source.jpg"
+    target_file = temp_dir / "target.jpg"
+    source_file.write_text("source content")
+    target_file.write_text("existing content")
+
+    assert not file_ops.safe_rename(source_file, target_file, verify=True)
+    assert source_file.read_text() == "source content"
+    assert target_file.read_text() == "existing content"
+
+
 def test_file_operations_safe_rename_dry_run(sample_config, logger, temp_dir):
     """Test safe_rename in dry run mode"""
-    from photo_organizer.file_utils import FileOperations
-
     sample_config.dry_run = True
     file_ops = FileOperations(sample_config, logger)
 
@@ -457,3 +684,210 @@ def test_file_operations_safe_rename_dry_run(sample_config, logger, temp_dir):
     # In dry run, original file should still exist
     assert source_file.exists()
     assert not target_file.exists()
+
+
+def test_file_operations_creates_target_dir_once(sample_config, logger, temp_dir):
+    """Test that a shared target directory is only created once"""
+    file_ops = FileOperations(sample_config, logger)
+    target_dir = temp_dir / "archive" / "2023" / "2023_12"
+
+    sources = []
+    for i in range(3):
+        source_file = temp_dir / f"source_{i}.jpg"
+        source_file.write_text(f"content {i}")
+        sources.append(source_file)
+
+    original_makedirs = os.makedirs
+    with patch(
+        "photo_organizer.file_utils.os.makedirs", side_effect=original_makedirs
+    ) as mock_makedirs:
+        for i, source_file in enumerate(sources):
+            assert file_ops.safe_copy(source_file, target_dir / f"target_{i}.jpg")
+
+    # makedirs recurses into itself for missing parents; only count our own calls
+    target_dir_calls = [
+        c for c in mock_makedirs.call_args_list
+        if c.args == (str(target_dir),)
+    ]
+    assert len(target_dir_calls) == 1
+    assert len(list(target_dir.iterdir())) == 3
+
+
+def test_checksum_uses_configured_algorithm(temp_dir, logger):
+    """Test that copy verification hashes with the configured algorithm"""
+    test_file = temp_dir / "data.bin"
+    test_file.write_bytes(b"photo data" * 200_000)  # Spans several read buffers
+
+    data = test_file.read_bytes()
+    file_ops = FileOperations(Config(), logger)
+    assert file_ops._calculate_checksum(test_file) == hashlib.blake2b(data).hexdigest()
+
+    file_ops = FileOperations(Config(hash_algorithm="sha256"), logger)
+    assert file_ops._calculate_checksum(test_file) == hashlib.sha256(data).hexdigest()
+
+
+def test_process_directory_same_timestamp_gets_suffixes(
+    organizer, temp_dir, monkeypatch
+):
+    """Test that files placed during one run are seen by later conflict checks"""
+    input_dir = temp_dir / "input"
+    input_dir.mkdir()
+    for i in range(3):
+        (input_dir / f"IMG_{i:04d}.jpg").write_text(f"different content {i}")
+
+    monkeypatch.setattr(
+        organizer.metadata_extractor,
+        "get_creation_date",
+        lambda x: datetime(2023, 12, 25, 14, 30, 45),
+    )
+
+    results = organizer.process_directory(input_dir)
+
+    assert results['processed'] == 3
+    target_dir = organizer.config.output_dir / "2023" / "2023_12"
+    assert sorted(p.name for p in target_dir.iterdir()) == [
+        "2023-12-25_14-30-45.jpg",
+        "2023-12-25_14-30-45_001.jpg",
+        "2023-12-25_14-30-45_002.jpg",
+    ]
+    assert organizer._dir_listings is None
+
+
+def test_process_directory_writes_processed_records_in_batches(
+    organizer, temp_dir, monkeypatch
+):
+    """Test that processed-file records are written per batch, not per file"""
+    input_dir = temp_dir / "input"
+    input_dir.mkdir()
+    for i in range(3):
+        (input_dir / f"IMG_{i:04d}.jpg").write_text(f"different content {i}")
+
+    monkeypatch.setattr(
+        organizer.metadata_extractor,
+        "get_creation_date",
+        lambda x: datetime(2023, 12, 25, 14, 30, 45),
+    )
+    organizer.MARK_BATCH_SIZE = 2
+
+    batch_sizes = []
+    write_marks = organizer._write_marks
+
+    def record_batch(records):
+        batch_sizes.append(len(records))
+        write_marks(records)
+
+    with patch.object(organizer, "_write_marks", side_effect=record_batch):
+        results = organizer.process_directory(input_dir)
+
+    assert results['processed'] == 3
+    assert batch_sizes == [2, 1]
+    conn = sqlite3.connect(organizer.processed_files_db)
+    assert conn.execute("SELECT COUNT(*) FROM processed_files").fetchone()[0] == 3
+    conn.close()
+    assert organizer._pending_marks is None
+
+
+def test_process_directory_reads_processed_records_once(
+    organizer, temp_dir, monkeypatch
+):
+    """Test that a rerun skips processed files using a single database read"""
+    input_dir = temp_dir / "input"
+    input_dir.mkdir()
+    for i in range(3):
+        (input_dir / f"IMG_{i:04d}.jpg").write_text(f"different content {i}")
+
+    organizer.config.copy_mode = True
+    monkeypatch.setattr(
+        organizer.metadata_extractor,
+        "get_creation_date",
+        lambda x: datetime(2023, 12, 25, 14, 30, 45),
+    )
+    assert organizer.process_directory(input_dir)['processed'] == 3
+
+    with patch(
+        "photo_organizer.organizer.sqlite3.connect", wraps=sqlite3.connect
+    ) as spy:
+        results = organizer.process_directory(input_dir)
+
+    assert results['duplicates'] == 3
+    assert spy.call_count == 1
+    assert organizer._processed_index is None
+
+
+def test_process_directory_reuses_checksums_of_placed_files(
+    organizer, temp_dir, monkeypatch
+):
+    """Test that a conflict with a file placed in the same run is not re-hashed"""
+    input_dir = temp_dir / "input"
+    (input_dir / "a").mkdir(parents=True)
+    (input_dir / "b").mkdir()
+    (input_dir / "a" / "IMG_0001.jpg").write_text("same content")
+    (input_dir / "b" / "IMG_0001.jpg").write_text("same content")
+
+    monkeypatch.setattr(
+        organizer.metadata_extractor,
+        "get_creation_date",
+        lambda x: datetime(2023, 12, 25, 14, 30, 45),
+    )
+
+    with patch.object(
+        organizer, "_get_file_checksum", wraps=organizer._get_file_checksum
+    ) as spy:
+        results = organizer.process_directory(input_dir)
+
+    assert results['processed'] == 1
+    assert results['duplicates'] == 1
+    spy.assert_not_called()
+    assert organizer._placed_checksums is None
+
+
+def test_process_directory_suffixes_follow_sorted_order(temp_dir, logger, monkeypatch):
+    """Test that duplicate suffixes are assigned in sorted source order"""
+    config = Config(output_dir=temp_dir / "archive", extensions=['jpg'], max_workers=8)
+    organizer = PhotoOrganizer(config, logger)
+    monkeypatch.setattr(
+        organizer.metadata_extractor,
+        "get_creation_date",
+        lambda x: datetime(2023, 12, 25, 14, 30, 45),
+    )
+
+    input_dir = temp_dir / "input"
+    for name in ["c.jpg", "a.jpg", "sub/b.jpg"]:
+        file_path = input_dir / name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(f"content of {name}")
+
+    organizer.process_directory(input_dir)
+
+    target_dir = config.output_dir / "2023" / "2023_12"
+    assert (target_dir / "2023-12-25_14-30-45.jpg").read_text() == "content of a.jpg"
+    assert (
+        (target_dir / "2023-12-25_14-30-45_001.jpg").read_text() == "content of c.jpg"
+    )
+    assert (
+        (target_dir / "2023-12-25_14-30-45_002.jpg").read_text()
+        == "content of sub/b.jpg"
+    )
+
+
+def test_file_operations_failed_copy_leaves_no_partial_file(
+    sample_config, logger, temp_dir
+):
+    """Test that a failed copy leaves neither the target nor a temporary file behind"""
+    file_ops = FileOperations(sample_config, logger)
+    source_file = temp_dir / "source.jpg"
+    source_file.write_text("test content")
+    target_dir = temp_dir / "archive" / "2023" / "2023_12"
+    target_file = target_dir / "target.jpg"
+
+    with patch.object(
+        file_ops, "_calculate_checksum", side_effect=["good", "corrupted"]
+    ):
+        assert not file_ops.safe_move(source_file, target_file)
+
+    assert source_file.exists()
+    assert list(target_dir.iterdir()) == []
+
+    assert file_ops.safe_move(source_file, target_file)
+    assert not source_file.exists()
+    assert [p.name for p in target_dir.iterdir()] == ["target.jpg"]
@@ -4,198 +4,165 @@ Critical safety tests - these must NEVER fail!
 
 from datetime import datetime
 import os
+from unittest.mock import Mock
+
+import pytest
 
 from photo_organizer.organizer import PhotoOrganizer
 from photo_organizer.config import Config
 
 
-class TestCriticalSafety:
-    """Critical safety tests that must never fail"""
-
-    def test_shutil_move_dangerous_behavior(self, temp_dir, logger):
-        """
-        CRITICAL: Files must NEVER be deleted if the move/copy operation fails.
+def _assert_file_unchanged(organizer, path, original_content, original_checksum):
+    """Assert that a source file still exists with exactly its original content
 
-        This test simulates a scenario where the target directory creation or
-        file operation fails AFTER the source file would be deleted by shutil.move().
-        The original file MUST still exist.
-        """
-        # Create test setup
-        config = Config(
-            output_dir=temp_dir / "archive",
-            extensions=['jpg'],
-            dry_run=False,
-            copy_mode=False,  # Use move mode to test the dangerous operation
-            verify_checksums=True
+    The content comparison alone proves the file is intact; the checksum is
+    only computed again to describe a failure.
+    """
+    assert path.exists(), f"CRITICAL SAFETY FAILURE: Original file {path} was deleted!"
+    if path.read_bytes() != original_content:
+        current_checksum = organizer._get_file_checksum(path)
+        pytest.fail(
+            f"CRITICAL SAFETY FAILURE: Original file content changed! "
+            f"(checksum {original_checksum} -> {current_checksum})"
         )
 
-        organizer = PhotoOrganizer(config, logger)
-
-        # Create a test file with known content
-        test_file = temp_dir / "test_photo.jpg"
-        original_content = "fake photo content for safety test"
-        test_file.write_text(original_content)
-
-        # Verify file exists and get its checksum
-        assert test_file.exists()
-        original_checksum = organizer._get_file_checksum(test_file)
-
-        # Create a scenario where the target directory cannot be created
-        # by creating a file with the same name as the target directory
-        target_year_dir = config.output_dir / "2023"
-        target_year_dir / "2023_12"
 
-        # Create the year directory as a file (not a directory) to cause failure
+@pytest.fixture
+def organizer(temp_dir, logger):
+    """Create a move-mode organizer with checksum verification
+
+    Deliberately function-scoped: each safety test must start from a fresh
+    archive, database and directory cache, so no test can pass because of
+    state left behind by another.
+    """
+    config = Config(
+        output_dir=temp_dir / "archive",
+        extensions=['jpg'],
+        dry_run=False,
+        copy_mode=False,  # Move mode - deletes the source, the dangerous case
+        verify_checksums=True
+    )
+    return PhotoOrganizer(config, logger)
+
+
+@pytest.fixture(scope="session")
+def _chmod_works(tmp_path_factory):
+    """Skip unless a read-only directory actually refuses writes
+
+    Root (e.g. in CI containers) and some filesystems ignore mode bits, in which
+    case a permission-error test would pass or fail for the wrong reason.
+    """
+    if os.name == "nt":
+        pytest.skip("POSIX mode bits required")
+
+    probe_dir = tmp_path_factory.mktemp("chmod_probe")
+    os.chmod(probe_dir, 0o444)  # Same mode as the readonly_dir case
+    try:
+        (probe_dir / "probe").write_bytes(b"x")
+    except PermissionError:
+        return
+    finally:
+        os.chmod(probe_dir, 0o755)
+    pytest.skip("chmod read-only not enforced on this filesystem")
+
+
+@pytest.fixture
+def failure_injector(request, organizer, monkeypatch):
+    """Make moving a file into the 2023/2023_12 archive directory fail
+
+    request.param selects the failure:
+      dir_is_file   - the year directory is a file, so the target directory
+                      cannot be created
+      readonly_dir  - the target directory exists but is not writable
+      bad_checksum  - the copy's verification checksum does not match
+    """
+    config = organizer.config
+    target_year_dir = config.output_dir / "2023"
+
+    if request.param == "dir_is_file":
         config.output_dir.mkdir(parents=True, exist_ok=True)
-        target_year_dir.write_text("this is a file, not a directory")
-
-        # Mock the creation date to ensure predictable target path
-        creation_date = datetime(2023, 12, 25, 14, 30, 45)
-
-        # Monkey patch the metadata extractor to return our test date
-        def mock_get_creation_date(file_path):
-            return creation_date
-
-        organizer.metadata_extractor.get_creation_date = mock_get_creation_date
+        target_year_dir.write_bytes(b"this is a file, not a directory")
+        yield
 
-        # Now attempt to process the file - this should fail
-        # because target_year_dir is a file, not a directory
-        result = organizer.process_file(test_file)
-
-        # CRITICAL ASSERTION: The original file must still exist!
-        assert test_file.exists(), f"CRITICAL SAFETY FAILURE: Original file {test_file} was deleted!"
-
-        # CRITICAL ASSERTION: The original file content must be intact!
-        assert test_file.read_text() == original_content, "CRITICAL SAFETY FAILURE: Original file content was corrupted!"
-
-        # CRITICAL ASSERTION: The checksum must match original
-        current_checksum = organizer._get_file_checksum(test_file)
-        assert current_checksum == original_checksum, "CRITICAL SAFETY FAILURE: File checksum changed!"
-
-        # The operation should have failed
-        assert not result['success'], "Operation should have failed due to directory creation issue"
-
-        # Clean up the blocking file for next test
-        target_year_dir.unlink()
-
-    def test_never_delete_files_on_permission_error(self, temp_dir, logger):
-        """
-        CRITICAL: Files must never be deleted if target location is not writable
-        """
-        config = Config(
-            output_dir=temp_dir / "archive",
-            extensions=['jpg'],
-            dry_run=False,
-            copy_mode=False,  # Move mode
-            verify_checksums=True
-        )
-
-        organizer = PhotoOrganizer(config, logger)
-
-        # Create test file
-        test_file = temp_dir / "permission_test.jpg"
-        original_content = "content for permission test"
-        test_file.write_text(original_content)
-        original_checksum = organizer._get_file_checksum(test_file)
-
-        # Create target structure but make it read-only
-        target_dir = config.output_dir / "2023" / "2023_12"
+    elif request.param == "readonly_dir":
+        request.getfixturevalue("_chmod_works")
+        target_dir = target_year_dir / "2023_12"
         target_dir.mkdir(parents=True, exist_ok=True)
-
-        # Remove write permissions on target directory
         os.chmod(target_dir, 0o444)  # Read-only
-
-        # Mock creation date
-        creation_date = datetime(2023, 12, 25, 14, 30, 45)
-        organizer.metadata_extractor.get_creation_date = lambda x: creation_date
-
         try:
-            # Attempt to process - should fail due to permissions
-            result = organizer.process_file(test_file)
-
-            # CRITICAL: Original file must still exist
-            assert test_file.exists(), "CRITICAL: Original file was deleted despite permission error!"
-            assert test_file.read_text() == original_content, "CRITICAL: Original file content changed!"
-            assert organizer._get_file_checksum(test_file) == original_checksum, "CRITICAL: File checksum changed!"
-
-            # Operation should have failed
-            assert not result['success'], "Operation should have failed due to permission error"
-
+            yield
         finally:
             # Restore permissions for cleanup
             os.chmod(target_dir, 0o755)
 
-    def test_never_delete_on_checksum_verification_failure(self, temp_dir, logger):
-        """
-        CRITICAL: If checksum verification fails, original file must not be deleted
-        """
-        config = Config(
-            output_dir=temp_dir / "archive",
-            extensions=['jpg'],
-            dry_run=False,
-            copy_mode=False,  # Move mode - most dangerous
-            verify_checksums=True
+    elif request.param == "bad_checksum":
+        # The source hashes fine, then verification of the copy sees a corrupted file
+        monkeypatch.setattr(
+            organizer.file_ops, "_calculate_checksum",
+            Mock(side_effect=["source_checksum", "corrupted_checksum"])
         )
+        yield
 
-        organizer = PhotoOrganizer(config, logger)
+    else:
+        raise ValueError(f"Unknown failure: {request.param}")
 
-        # Create test file
-        test_file = temp_dir / "checksum_test.jpg"
-        original_content = "content for checksum test"
-        test_file.write_text(original_content)
-        organizer._get_file_checksum(test_file)
 
-        # Mock creation date
-        creation_date = datetime(2023, 12, 25, 14, 30, 45)
-        organizer.metadata_extractor.get_creation_date = lambda x: creation_date
-
-        # Mock the checksum verification to simulate corruption
-        original_calculate_checksum = organizer.file_ops._calculate_checksum
-        call_count = 0
-
-        def mock_checksum(file_path, algorithm='sha256'):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                # First call (before operation) - return correct checksum
-                return original_calculate_checksum(file_path, algorithm)
-            else:
-                # Second call (verification of target) - return wrong checksum to simulate corruption
-                return "corrupted_checksum"
-
-        organizer.file_ops._calculate_checksum = mock_checksum
-
-        # Process file - should fail verification
+class TestCriticalSafety:
+    """Critical safety tests that must never fail"""
+
+    @pytest.mark.parametrize(
+        "failure_injector",
+        ["dir_is_file", "readonly_dir", "bad_checksum"],
+        indirect=True,
+    )
+    def test_never_delete_on_failure(
+        self, temp_dir, organizer, failure_injector, monkeypatch
+    ):
+        """
+        CRITICAL: Files must NEVER be deleted if the move operation fails.
+
+        Whether the target directory cannot be created, cannot be written, or
+        the copy fails verification, the source must be left exactly as it was
+        (shutil.move() would already have deleted it in some of these cases).
+        """
+        # Create a test file with known content
+        test_file = temp_dir / "test_photo.jpg"
+        original_content = b"fake photo content for safety test"
+        test_file.write_bytes(original_content)
+        original_checksum = organizer._get_file_checksum(test_file)
+
+        # Mock the creation date to ensure predictable target path
+        monkeypatch.setattr(
+            organizer.metadata_extractor, "get_creation_date",
+            lambda _p: datetime(2023, 12, 25, 14, 30, 45)
+        )
+
+        # Now attempt to process the file - this should fail
         result = organizer.process_file(test_file)
 
-        # CRITICAL: Original file must still exist even though verification failed
-        assert test_file.exists(), "CRITICAL: Original file deleted despite checksum verification failure!"
-        assert test_file.read_text() == original_content, "CRITICAL: Original file content changed!"
+        # CRITICAL ASSERTION: The original file must still exist, fully intact!
+        _assert_file_unchanged(
+            organizer, test_file, original_content, original_checksum
+        )
 
-        # Operation should have failed
-        assert not result['success'], "Operation should have failed due to checksum mismatch"
+        # The operation should have failed
+        assert not result.success, "Operation should have failed"
 
-    def test_atomic_operations_no_partial_state(self, temp_dir, logger):
+    def test_atomic_operations_no_partial_state(self, temp_dir, organizer, monkeypatch):
         """
         CRITICAL: Operations must be atomic - no partial state where file is moved but not verified
         """
-        config = Config(
-            output_dir=temp_dir / "archive",
-            extensions=['jpg'],
-            dry_run=False,
-            copy_mode=False,
-            verify_checksums=True
-        )
-
-        organizer = PhotoOrganizer(config, logger)
+        config = organizer.config
 
         # Create test file
         test_file = temp_dir / "atomic_test.jpg"
-        test_file.write_text("atomic test content")
+        test_file.write_bytes(b"atomic test content")
 
         # Mock creation date
-        creation_date = datetime(2023, 12, 25, 14, 30, 45)
-        organizer.metadata_extractor.get_creation_date = lambda x: creation_date
+        monkeypatch.setattr(
+            organizer.metadata_extractor, "get_creation_date",
+            lambda _p: datetime(2023, 12, 25, 14, 30, 45)
+        )
 
         # Expected target path
         expected_target = config.output_dir / "2023" / "2023_12" / "2023-12-25_14-30-45.jpg"
@@ -203,11 +170,11 @@ class TestCriticalSafety:
         # Process successfully first to verify normal operation
         result = organizer.process_file(test_file)
 
-        if result['success']:
+        if result.success:
             # File should be moved to target
             assert not test_file.exists(), "Source file should be gone after successful move"
             assert expected_target.exists(), "Target file should exist after successful move"
-            assert expected_target.read_text() == "atomic test content"
+            assert expected_target.read_bytes() == b"atomic test content"
         else:
             # If it failed, original should still be there
             assert test_file.exists(), "CRITICAL: Source file missing after failed operation!"